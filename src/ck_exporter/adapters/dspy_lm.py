@@ -3,9 +3,10 @@
 import os
 from typing import Optional
 
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
 
-load_dotenv()
+# Look for .env from the working directory upwards (not from this installed file)
+load_dotenv(find_dotenv(usecwd=True))
 
 
 def configure_dspy_lm(model: str, use_openrouter: bool = True):
@@ -4,6 +4,9 @@ import json
 from pathlib import Path
 from typing import Any, Iterable
 
+from ck_exporter.utils.fast_json import dumps as _json_dumps
+from ck_exporter.utils.fast_json import loads as _json_loads
+
 
 def read_jsonl(path: Path) -> Iterable[dict[str, Any]]:
     """
@@ -23,7 +26,7 @@ def read_jsonl(path: Path) -> Iterable[dict[str, Any]]:
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = _json_loads(line)
             except json.JSONDecodeError:
                 continue
             if isinstance(obj, dict):
@@ -44,7 +47,7 @@ def write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
     temp_path = path.with_suffix(path.suffix + ".tmp")
     with temp_path.open("w", encoding="utf-8") as f:
         for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            f.write(_json_dumps(row) + "\n")
     temp_path.replace(path)
 
 
@@ -61,14 +64,13 @@ def load_atoms_jsonl(file_path: Path) -> list[dict[str, Any]]:
     if not file_path.exists():
         return []
 
+    # Read the whole file in one call and parse lines straight from bytes
     atoms = []
-    with file_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    atoms.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+    for line in file_path.read_bytes().splitlines():
+        if line.strip():
+            try:
+                atoms.append(_json_loads(line))
+            except json.JSONDecodeError:
+                continue
 
     return atoms
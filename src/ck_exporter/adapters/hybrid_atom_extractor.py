@@ -44,6 +44,22 @@ class HybridAtomExtractor:
         """
         return self.openrouter_extractor.extract_from_chunk(chunk_text)
 
+    def chunk_request_body(self, chunk_text: str) -> dict[str, Any]:
+        """
+        Build the Pass 1 chat completions request body for the Batch API.
+
+        Delegates to OpenRouter extractor.
+        """
+        return self.openrouter_extractor.chunk_request_body(chunk_text)
+
+    def parse_chunk_response(self, content: str | None, repair: bool = True) -> dict[str, Any]:
+        """
+        Parse a Pass 1 completion into candidate atoms.
+
+        Delegates to OpenRouter extractor.
+        """
+        return self.openrouter_extractor.parse_chunk_response(content, repair=repair)
+
     def refine_atoms(
         self,
         all_candidates: dict[str, list[dict[str, Any]]],
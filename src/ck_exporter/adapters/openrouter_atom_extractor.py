@@ -1,7 +1,11 @@
 """OpenRouter-backed atom extractor adapter."""
 
+import hashlib
 import json
-from typing import Any
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
 
 from ck_exporter.core.ports.atom_extractor import AtomExtractor
 from ck_exporter.core.ports.llm import LLMClient
@@ -11,10 +15,16 @@ from ck_exporter.programs.extraction_prompts import (
     PASS2_REFINEMENT_PROMPT,
 )
 from ck_exporter.programs.json_extract import extract_json_from_text
+from ck_exporter.utils import fast_json
 from ck_exporter.utils.atom_candidates import deduplicate_candidates
 
 logger = get_logger(__name__)
 
+PASS1_SYSTEM_PROMPT = (
+    "You are a knowledge extraction assistant. Return only valid JSON, no markdown, no code blocks."
+)
+PASS1_TEMPERATURE = 0.3
+
 
 class OpenRouterAtomExtractor:
     """OpenRouter-backed implementation of AtomExtractor."""
@@ -25,6 +35,7 @@ class OpenRouterAtomExtractor:
         big_llm: LLMClient,
         fast_model: str = "z-ai/glm-4.7",
         big_model: str = "z-ai/glm-4.7",
+        cache_dir: Optional[Path] = None,
     ):
         """
         Initialize atom extractor.
@@ -34,11 +45,48 @@ class OpenRouterAtomExtractor:
             big_llm: LLM client for Pass 2 (refinement)
             fast_model: Model identifier for Pass 1
             big_model: Model identifier for Pass 2
+            cache_dir: Optional directory for caching Pass 1 chunk results
         """
         self.fast_llm = fast_llm
         self.big_llm = big_llm
         self.fast_model = fast_model
         self.big_model = big_model
+        self.cache_dir = cache_dir
+
+    def _chunk_cache_path(self, prompt: str) -> Optional[Path]:
+        """Cache file for a Pass 1 prompt, keyed by model, temperature, system prompt and full prompt text."""
+        if self.cache_dir is None:
+            return None
+        key_string = f"{self.fast_model}:{PASS1_TEMPERATURE}:{PASS1_SYSTEM_PROMPT}:{prompt}"
+        return self.cache_dir / f"{hashlib.sha256(key_string.encode('utf-8')).hexdigest()}.json"
+
+    def _load_chunk_result(self, cache_path: Path) -> Optional[dict[str, Any]]:
+        """Load a cached Pass 1 result if it exists."""
+        try:
+            return fast_json.loads(cache_path.read_bytes())
+        except Exception:
+            # Missing or unreadable entry: treat as a miss
+            return None
+
+    def _save_chunk_result(self, cache_path: Path, result: dict[str, Any]) -> None:
+        """Save a Pass 1 result to the cache (atomic write via a uniquely named temp file)."""
+        temp_name = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp name so concurrent writers of the same chunk don't collide
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as f:
+                temp_name = f.name
+                f.write(fast_json.dumps(result))
+            os.replace(temp_name, cache_path)
+        except Exception:
+            # Cache failures shouldn't break the pipeline
+            if temp_name is not None:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
 
     def extract_from_chunk(self, chunk_text: str) -> dict[str, Any]:
         """
@@ -52,14 +100,20 @@ class OpenRouterAtomExtractor:
         """
         prompt = PASS1_EXTRACTION_PROMPT.format(chunk_text=chunk_text)
 
+        cache_path = self._chunk_cache_path(prompt)
+        if cache_path is not None:
+            cached = self._load_chunk_result(cache_path)
+            if cached is not None:
+                return cached
+
         try:
             # Try with json_object=True first (structured output reduces repair calls)
             try:
                 content = self.fast_llm.chat(
                     model=self.fast_model,
-                    system="You are a knowledge extraction assistant. Return only valid JSON, no markdown, no code blocks.",
+                    system=PASS1_SYSTEM_PROMPT,
                     user=prompt,
-                    temperature=0.3,
+                    temperature=PASS1_TEMPERATURE,
                     json_object=True,
                 )
             except Exception as e:
@@ -72,71 +126,128 @@ class OpenRouterAtomExtractor:
                     )
                     content = self.fast_llm.chat(
                         model=self.fast_model,
-                        system="You are a knowledge extraction assistant. Return only valid JSON, no markdown, no code blocks.",
+                        system=PASS1_SYSTEM_PROMPT,
                         user=prompt,
-                        temperature=0.3,
+                        temperature=PASS1_TEMPERATURE,
                         json_object=False,
                     )
                 else:
                     # Re-raise if it's a different error
                     raise
 
-            if not content:
-                return {"facts": [], "decisions": [], "open_questions": []}
+            result = self.parse_chunk_response(content)
+            # Empty results may be parse failures; leave them uncached so a re-run retries
+            if cache_path is not None and any(result.values()):
+                self._save_chunk_result(cache_path, result)
+            return result
+
+        except Exception as e:
+            logger.exception(
+                "Error in fast extraction",
+                extra={"event": "extractor.pass1.error"},
+            )
+            return {"facts": [], "decisions": [], "open_questions": []}
+
+    def chunk_request_body(self, chunk_text: str) -> dict[str, Any]:
+        """
+        Build the chat completions request body for a Pass 1 chunk.
+
+        Used by the Batch API path, which submits requests offline instead of
+        calling the LLM client directly.
 
-            # Try parsing JSON directly
+        Args:
+            chunk_text: Formatted conversation chunk text
+
+        Returns:
+            Request body for POST /v1/chat/completions
+        """
+        return {
+            "model": self.fast_model,
+            "messages": [
+                {"role": "system", "content": PASS1_SYSTEM_PROMPT},
+                {"role": "user", "content": PASS1_EXTRACTION_PROMPT.format(chunk_text=chunk_text)},
+            ],
+            "temperature": PASS1_TEMPERATURE,
+            "response_format": {"type": "json_object"},
+        }
+
+    def parse_chunk_response(self, content: str | None, repair: bool = True) -> dict[str, Any]:
+        """
+        Parse a Pass 1 completion into candidate atoms, repairing it if needed.
+
+        Plain JSON is parsed directly, then JSON inside markdown code blocks. As a
+        last resort (when ``repair`` is set) the completion is sent back to the fast
+        model with a repair prompt, which is a live, blocking LLM call.
+
+        Args:
+            content: Raw completion text
+            repair: Whether to fall back to the LLM repair call
+
+        Returns:
+            Dict with keys: "facts", "decisions", "open_questions"
+        """
+        if not content:
+            return {"facts": [], "decisions": [], "open_questions": []}
+
+        # Try parsing JSON directly
+        try:
             result = json.loads(content)
-            if isinstance(result, dict):
-                return {
-                    "facts": result.get("facts", []),
-                    "decisions": result.get("decisions", []),
-                    "open_questions": result.get("open_questions", []),
-                }
+        except json.JSONDecodeError:
+            result = None
+        if isinstance(result, dict):
+            return {
+                "facts": result.get("facts", []),
+                "decisions": result.get("decisions", []),
+                "open_questions": result.get("open_questions", []),
+            }
 
-            # Try extracting from markdown code blocks
-            result = extract_json_from_text(content)
-            if result:
-                return {
-                    "facts": result.get("facts", []),
-                    "decisions": result.get("decisions", []),
-                    "open_questions": result.get("open_questions", []),
-                }
+        # Try extracting from markdown code blocks
+        result = extract_json_from_text(content)
+        if result:
+            return {
+                "facts": result.get("facts", []),
+                "decisions": result.get("decisions", []),
+                "open_questions": result.get("open_questions", []),
+            }
 
-            # Last resort: retry with repair prompt
+        if not repair:
             logger.warning(
-                "JSON parse failed, attempting repair",
-                extra={"event": "extractor.pass1.json_repair"},
-            )
-            repair_content = self.fast_llm.chat(
-                model=self.fast_model,
-                system="You are a JSON repair assistant. Extract and return ONLY valid JSON, no other text.",
-                user=f"Repair this JSON output to be valid:\n\n{content}",
-                temperature=0.1,
-            )
-            if repair_content:
-                result = extract_json_from_text(repair_content) or json.loads(repair_content)
-                if result:
-                    return {
-                        "facts": result.get("facts", []),
-                        "decisions": result.get("decisions", []),
-                        "open_questions": result.get("open_questions", []),
-                    }
-
-            logger.error(
-                "Failed to parse JSON after repair",
+                "Failed to parse JSON",
                 extra={
                     "event": "extractor.pass1.json_parse_failed",
-                    "response_preview": content[:200] if content else None,
+                    "response_preview": content[:200],
                 },
             )
             return {"facts": [], "decisions": [], "open_questions": []}
 
-        except Exception as e:
-            logger.exception(
-                "Error in fast extraction",
-                extra={"event": "extractor.pass1.error"},
-            )
-            return {"facts": [], "decisions": [], "open_questions": []}
+        # Last resort: retry with repair prompt
+        logger.warning(
+            "JSON parse failed, attempting repair",
+            extra={"event": "extractor.pass1.json_repair"},
+        )
+        repair_content = self.fast_llm.chat(
+            model=self.fast_model,
+            system="You are a JSON repair assistant. Extract and return ONLY valid JSON, no other text.",
+            user=f"Repair this JSON output to be valid:\n\n{content}",
+            temperature=0.1,
+        )
+        if repair_content:
+            result = extract_json_from_text(repair_content) or json.loads(repair_content)
+            if result:
+                return {
+                    "facts": result.get("facts", []),
+                    "decisions": result.get("decisions", []),
+                    "open_questions": result.get("open_questions", []),
+                }
+
+        logger.error(
+            "Failed to parse JSON after repair",
+            extra={
+                "event": "extractor.pass1.json_parse_failed",
+                "response_preview": content[:200] if content else None,
+            },
+        )
+        return {"facts": [], "decisions": [], "open_questions": []}
 
     def refine_atoms(
         self,
@@ -1,18 +1,38 @@
 """Shared OpenRouter/OpenAI client factory."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
 from openai import OpenAI
 
-load_dotenv()
+# Look for .env from the working directory upwards (not from this installed file)
+load_dotenv(find_dotenv(usecwd=True))
+
+
+@lru_cache(maxsize=None)
+def _cached_client(
+    base_url: Optional[str],
+    api_key: str,
+    default_headers: tuple[tuple[str, str], ...],
+) -> OpenAI:
+    """Build one client per distinct configuration (its HTTP connection pool is thread-safe)."""
+    return OpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        default_headers=dict(default_headers) if default_headers else None,
+    )
 
 
 def make_openrouter_client(use_openrouter: bool = True) -> OpenAI:
     """
     Create an OpenAI-compatible client for OpenRouter or standard OpenAI.
 
+    Clients are cached per configuration, so every adapter in the process
+    (LLM, embedder, labeler) reuses the same keep-alive connection pool
+    instead of paying a fresh TCP/TLS handshake per client.
+
     Args:
         use_openrouter: If True, use OpenRouter API; otherwise use standard OpenAI
 
@@ -33,13 +53,13 @@ def make_openrouter_client(use_openrouter: bool = True) -> OpenAI:
         if x_title:
             extra_headers["X-Title"] = x_title
 
-        return OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key,
-            default_headers=extra_headers if extra_headers else None,
+        return _cached_client(
+            "https://openrouter.ai/api/v1",
+            api_key,
+            tuple(sorted(extra_headers.items())),
         )
     else:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY must be set in environment")
-        return OpenAI(api_key=api_key)
+        return _cached_client(None, api_key, ())
@@ -1,6 +1,8 @@
 """OpenRouter-backed embedder adapter."""
 
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -9,7 +11,7 @@ from openai import OpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ck_exporter.adapters.openrouter_client import make_openrouter_client
-from ck_exporter.utils.chunking import chunk_text
+from ck_exporter.utils.chunking import chunk_texts_batch
 from ck_exporter.core.ports.embedder import Embedder
 
 # Pooling version for cache invalidation
@@ -61,6 +63,24 @@ class OpenRouterEmbedder:
         except Exception as e:
             raise RuntimeError(f"Failed to get embeddings: {e}") from e
 
+    def _embed_batches(self, batches: list[list[str]]) -> list[np.ndarray]:
+        """
+        Embed several batches, keeping up to CKX_EMBED_MAX_INFLIGHT requests in flight.
+
+        Args:
+            batches: List of text batches (each up to the API batch limit)
+
+        Returns:
+            List of embedding arrays, in the same order as ``batches``
+        """
+        max_inflight = int(os.getenv("CKX_EMBED_MAX_INFLIGHT", "4"))
+        if len(batches) <= 1 or max_inflight <= 1:
+            return [self._get_embeddings_batch(batch) for batch in batches]
+
+        # Executor.map preserves input order regardless of completion order
+        with ThreadPoolExecutor(max_workers=min(max_inflight, len(batches))) as executor:
+            return list(executor.map(self._get_embeddings_batch, batches))
+
     def embed(self, texts: list[str], batch_size: int = 100) -> np.ndarray:
         """
         Get embeddings for multiple texts, batching as needed.
@@ -75,11 +95,8 @@ class OpenRouterEmbedder:
         if not texts:
             return np.array([])
 
-        all_embeddings = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            batch_embeddings = self._get_embeddings_batch(batch)
-            all_embeddings.append(batch_embeddings)
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        all_embeddings = self._embed_batches(batches)
 
         if not all_embeddings:
             return np.array([])
@@ -95,13 +112,11 @@ class OpenRouterEmbedder:
         """Load embedding from cache if it exists."""
         if cache_dir is None:
             return None
-        cache_file = cache_dir / f"{cache_key}.npy"
-        if cache_file.exists():
-            try:
-                return np.load(cache_file)
-            except Exception:
-                return None
-        return None
+        try:
+            return np.load(cache_dir / f"{cache_key}.npy")
+        except Exception:
+            # Missing or unreadable entry: treat as a miss
+            return None
 
     def _save_to_cache(self, cache_dir: Path, cache_key: str, embedding: np.ndarray) -> None:
         """Save embedding to cache."""
@@ -200,13 +215,14 @@ class OpenRouterEmbedder:
         all_chunks = []
         chunk_to_doc_idx = []  # Maps chunk index to original document index
 
-        for doc_idx, text in enumerate(texts):
-            chunks = chunk_text(
-                text,
-                max_tokens=chunk_tokens,
-                overlap_tokens=overlap_tokens,
-                model=tokenizer_model,
-            )
+        chunked_texts = chunk_texts_batch(
+            texts,
+            max_tokens=chunk_tokens,
+            overlap_tokens=overlap_tokens,
+            model=tokenizer_model,
+        )
+
+        for doc_idx, chunks in enumerate(chunked_texts):
             # Filter out empty chunks
             chunks = [chunk for chunk in chunks if chunk.strip()]
             if not chunks:
@@ -223,9 +239,13 @@ class OpenRouterEmbedder:
         chunks_to_embed = []
         chunk_indices_to_embed = []
 
+        # Hash each chunk once; the same key is reused when saving new embeddings
+        cache_keys = [self._get_cache_key(chunk) for chunk in all_chunks] if cache_dir is not None else None
+
         for chunk_idx, chunk in enumerate(all_chunks):
-            cache_key = self._get_cache_key(chunk)
-            cached_embedding = self._load_from_cache(cache_dir, cache_key)
+            cached_embedding = (
+                self._load_from_cache(cache_dir, cache_keys[chunk_idx]) if cache_keys is not None else None
+            )
 
             if cached_embedding is not None:
                 chunk_embeddings_list.append((chunk_idx, cached_embedding))
@@ -235,19 +255,17 @@ class OpenRouterEmbedder:
 
         # Embed uncached chunks in batches
         if chunks_to_embed:
-            all_new_embeddings = []
-            for i in range(0, len(chunks_to_embed), batch_size):
-                batch = chunks_to_embed[i : i + batch_size]
+            batch_starts = range(0, len(chunks_to_embed), batch_size)
+            all_new_embeddings = self._embed_batches(
+                [chunks_to_embed[i : i + batch_size] for i in batch_starts]
+            )
+            for i, batch_embeddings in zip(batch_starts, all_new_embeddings):
                 batch_indices = chunk_indices_to_embed[i : i + batch_size]
-                batch_embeddings = self._get_embeddings_batch(batch)
 
                 # Save to cache
-                for chunk_idx, embedding in zip(batch_indices, batch_embeddings):
-                    chunk = all_chunks[chunk_idx]
-                    cache_key = self._get_cache_key(chunk)
-                    self._save_to_cache(cache_dir, cache_key, embedding)
-
-                all_new_embeddings.append(batch_embeddings)
+                if cache_keys is not None:
+                    for chunk_idx, embedding in zip(batch_indices, batch_embeddings):
+                        self._save_to_cache(cache_dir, cache_keys[chunk_idx], embedding)
 
             if all_new_embeddings:
                 new_embeddings = np.vstack(all_new_embeddings)
@@ -258,40 +276,45 @@ class OpenRouterEmbedder:
         chunk_embeddings_list.sort(key=lambda x: x[0])
         chunk_embeddings_array = np.array([emb for _, emb in chunk_embeddings_list])
 
-        # Group chunks by document and pool
-        num_docs = len(texts)
-        pooled_embeddings = []
-
-        # Get embedding dimension from first chunk (if available)
-        embedding_dim = None
-        if len(chunk_embeddings_array) > 0:
-            embedding_dim = chunk_embeddings_array.shape[1]
-
-        for doc_idx in range(num_docs):
-            # Find all chunks belonging to this document
-            doc_chunk_indices = [
-                i for i, orig_doc_idx in enumerate(chunk_to_doc_idx) if orig_doc_idx == doc_idx
-            ]
-            if not doc_chunk_indices:
-                # No chunks for this doc (empty or filtered out)
-                # Use a zero vector with same dimension as other embeddings
-                if embedding_dim is not None:
-                    zero_vec = np.zeros(embedding_dim)
-                    pooled_embeddings.append(zero_vec)
-                else:
-                    # No embeddings at all - this is an edge case
-                    # We'll need to get dimension from API, but for now skip
-                    # This document will be missing from results
-                    continue
-            else:
-                doc_chunk_embeddings = chunk_embeddings_array[doc_chunk_indices]
-                pooled = self._normalized_mean_pool(doc_chunk_embeddings)
-                pooled_embeddings.append(pooled)
+        return self._pool_by_document(chunk_embeddings_array, chunk_to_doc_idx, len(texts))
 
-        if not pooled_embeddings:
-            return np.array([])
+    def _pool_by_document(
+        self,
+        chunk_embeddings: np.ndarray,
+        chunk_to_doc_idx: list[int],
+        num_docs: int,
+    ) -> np.ndarray:
+        """
+        Normalized mean pooling of every document's chunks at once.
+
+        Equivalent to ``_normalized_mean_pool`` per document, but sums each
+        document's contiguous run of chunks with one ``np.add.reduceat``
+        instead of scanning all chunks once per document.
+
+        Args:
+            chunk_embeddings: Array of shape (n_chunks, embedding_dim), grouped by document
+            chunk_to_doc_idx: Owning document index for each chunk (non-decreasing)
+            num_docs: Number of documents
+
+        Returns:
+            Array of shape (num_docs, embedding_dim); documents without chunks get zero vectors
+        """
+        # L2-normalize each chunk vector (zero vectors stay zero)
+        norms = np.linalg.norm(chunk_embeddings, axis=1, keepdims=True)
+        normalized = chunk_embeddings / np.where(norms == 0, 1.0, norms)
+
+        counts = np.bincount(chunk_to_doc_idx, minlength=num_docs)
+        has_chunks = counts > 0
+        starts = np.cumsum(counts) - counts
+
+        # Mean pool each document's chunks
+        pooled = np.zeros((num_docs, chunk_embeddings.shape[1]), dtype=normalized.dtype)
+        pooled[has_chunks] = np.add.reduceat(normalized, starts[has_chunks], axis=0)
+        pooled[has_chunks] /= counts[has_chunks, None]
 
-        return np.array(pooled_embeddings)
+        # L2-normalize the pooled vectors
+        pooled_norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return pooled / np.where(pooled_norms == 0, 1.0, pooled_norms)
 
 
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
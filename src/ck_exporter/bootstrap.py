@@ -5,6 +5,7 @@ ensuring a single source of truth for dependency injection.
 """
 
 import os
+from pathlib import Path
 from typing import Optional
 
 from ck_exporter.adapters.dspy_atom_refiner import DspyAtomRefiner
@@ -74,6 +75,9 @@ def build_atom_extractor(
     - `openrouter`: OpenRouter for both Pass 1 and Pass 2 (default)
     - `dspy`: OpenRouter for Pass 1, DSPy for Pass 2 (hybrid)
 
+    Reads `CKX_CHUNK_CACHE_DIR` to cache Pass 1 chunk results on disk, so
+    re-runs skip the LLM for chunks that were already extracted.
+
     Args:
         fast_model: Model for Pass 1 (defaults to env or "z-ai/glm-4.7")
         big_model: Model for Pass 2 (defaults to env or "z-ai/glm-4.7")
@@ -86,6 +90,8 @@ def build_atom_extractor(
     # Set defaults from environment or hardcoded defaults
     fast_model = fast_model or os.getenv("CKX_FAST_MODEL", "z-ai/glm-4.7")
     big_model = big_model or os.getenv("CKX_BIG_MODEL", "z-ai/glm-4.7")
+    chunk_cache_dir = os.getenv("CKX_CHUNK_CACHE_DIR")
+    cache_dir = Path(chunk_cache_dir) if chunk_cache_dir else None
 
     # Create shared client if not provided
     if shared_client is None:
@@ -106,6 +112,7 @@ def build_atom_extractor(
                 big_llm=big_llm,  # Not used in hybrid mode, but required for constructor
                 fast_model=fast_model,
                 big_model=big_model,
+                cache_dir=cache_dir,
             )
 
             # Create DSPy refiner for Pass 2
@@ -132,6 +139,7 @@ def build_atom_extractor(
         big_llm=big_llm,
         fast_model=fast_model,
         big_model=big_model,
+        cache_dir=cache_dir,
     )
 
 
@@ -6,7 +6,7 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from ck_exporter.extract_openai import extract_export
+from ck_exporter.extract_openai import extract_export, validate_batch_options
 
 console = Console()
 
@@ -27,12 +27,20 @@ def extract_command(
     use_openrouter: bool = typer.Option(True, "--openrouter/--no-openrouter", help="Use OpenRouter API (default: True)"),
     conversation_id: str = typer.Option(None, "--conversation-id", "-c", help="Process only this conversation ID (for testing)"),
     limit: Optional[int] = typer.Option(None, "--limit", "-n", help="Limit number of conversations to process (deterministic: first N by sorted filename)"),
+    batch: bool = typer.Option(False, "--batch/--no-batch", help="Run Pass 1 through the OpenAI Batch API (cheaper, not interactive; requires --no-openrouter and OpenAI model ids)"),
 ) -> None:
     """Extract knowledge atoms from conversations using two-pass OpenRouter pipeline."""
     if not input.exists():
         console.print(f"[red]Input path not found: {input}[/red]")
         raise typer.Exit(1)
 
+    if batch:
+        try:
+            validate_batch_options(use_openrouter, fast_model, big_model)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1)
+
     extract_export(
         input,
         evidence,
@@ -44,4 +52,5 @@ def extract_command(
         use_openrouter=use_openrouter,
         conversation_id=conversation_id,
         limit=limit,
+        batch=batch,
     )
@@ -1,5 +1,6 @@
 """Run-all command."""
 
+import logging
 import sys
 from pathlib import Path
 from typing import Optional
@@ -66,21 +67,26 @@ def run_all_command(
 
         # Suppress normal console handler to prevent log spam
         # (dashboard will show logs in its panel, file handlers still work)
-        import logging
-
         root_logger = logging.getLogger()
         # Remove stderr StreamHandlers (but keep file handlers and dashboard handler)
         handlers_to_remove = [
             h
             for h in root_logger.handlers
-            if isinstance(h, logging.StreamHandler)
-            and hasattr(h, "stream")
-            and h.stream == sys.stderr
-            and h != dashboard_obj.log_handler
+            if getattr(h, "stream", None) is sys.stderr and not getattr(h, "_ck_dashboard", False)
         ]
         for handler in handlers_to_remove:
             root_logger.removeHandler(handler)
 
+    extract_kwargs = dict(
+        fast_model=fast_model,
+        big_model=big_model,
+        max_concurrency=max_concurrency,
+        skip_existing=skip_existing,
+        use_openrouter=use_openrouter,
+        conversation_id=conversation_id,
+        limit=limit,
+    )
+
     try:
         if dashboard_obj:
             # Run with dashboard
@@ -94,19 +100,7 @@ def run_all_command(
                 # Step 2: Extract
                 dashboard_obj.set_step_status("Extract", "running")
                 extract_cb = dashboard_obj.get_progress_callback("Extract")
-                extract_export(
-                    input,
-                    evidence_dir,
-                    atoms_dir,
-                    fast_model=fast_model,
-                    big_model=big_model,
-                    max_concurrency=max_concurrency,
-                    skip_existing=skip_existing,
-                    use_openrouter=use_openrouter,
-                    conversation_id=conversation_id,
-                    limit=limit,
-                    progress_cb=extract_cb,
-                )
+                extract_export(input, evidence_dir, atoms_dir, progress_cb=extract_cb, **extract_kwargs)
                 dashboard_obj.set_step_status("Extract", "complete")
 
                 # Step 3: Compile
@@ -116,33 +110,30 @@ def run_all_command(
                 dashboard_obj.set_step_status("Compile", "complete")
         else:
             # Run without dashboard (original behavior)
-            console.print("[bold]Running full pipeline[/bold]")
+            # Step banners and the completion summary are for humans; only
+            # machine mode suppresses them. There is no live rendering here,
+            # so redirected output still gets the plain summaries.
+            verbose = current_log_mode != "machine"
+            if verbose:
+                console.print("[bold]Running full pipeline[/bold]")
 
             # Step 1: Linearize
-            console.print("\n[bold cyan]Step 1: Linearizing conversations[/bold cyan]")
+            if verbose:
+                console.print("\n[bold cyan]Step 1: Linearizing conversations[/bold cyan]")
             linearize_export(input, evidence_dir, limit=limit)
 
             # Step 2: Extract
-            console.print("\n[bold cyan]Step 2: Extracting knowledge atoms[/bold cyan]")
-            extract_export(
-                input,
-                evidence_dir,
-                atoms_dir,
-                fast_model=fast_model,
-                big_model=big_model,
-                max_concurrency=max_concurrency,
-                skip_existing=skip_existing,
-                use_openrouter=use_openrouter,
-                conversation_id=conversation_id,
-                limit=limit,
-                progress_cb=None,
-            )
+            if verbose:
+                console.print("\n[bold cyan]Step 2: Extracting knowledge atoms[/bold cyan]")
+            extract_export(input, evidence_dir, atoms_dir, progress_cb=None, **extract_kwargs)
 
             # Step 3: Compile
-            console.print("\n[bold cyan]Step 3: Compiling documentation[/bold cyan]")
+            if verbose:
+                console.print("\n[bold cyan]Step 3: Compiling documentation[/bold cyan]")
             compile_docs(atoms_dir, docs_dir, progress_cb=None)
 
-            console.print("\n[bold green]✓ Pipeline complete![/bold green]")
+            if verbose:
+                console.print("\n[bold green]✓ Pipeline complete![/bold green]")
     finally:
         if dashboard_obj:
             dashboard_obj.remove_log_handler()
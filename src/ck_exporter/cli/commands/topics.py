@@ -6,6 +6,7 @@ from typing import Optional
 import typer
 from rich.console import Console
 
+from ck_exporter.core.models import Topic
 from ck_exporter.pipeline.assignment import assign_topics, load_topic_registry, save_assignments
 from ck_exporter.topic_discovery import (
     build_conversation_documents,
@@ -30,6 +31,7 @@ def discover_topics_command(
     chunk_tokens: int = typer.Option(600, "--chunk-tokens", help="Maximum tokens per chunk when pooling (default: 600)"),
     chunk_overlap: int = typer.Option(80, "--chunk-overlap", help="Token overlap between chunks when pooling (default: 80)"),
     embedding_cache_dir: Path = typer.Option(None, "--embedding-cache-dir", help="Directory for caching embeddings (default: .cache/embeddings)"),
+    dim_reduction: str = typer.Option("umap", "--dim-reduction", help="Dimensionality reduction before clustering: umap or pca (faster, deterministic)"),
     limit: Optional[int] = typer.Option(None, "--limit", "-n", help="Limit number of conversations to process (deterministic: first N by sorted filename)"),
 ) -> None:
     """Discover topics from conversation artifacts using BERTopic."""
@@ -37,6 +39,10 @@ def discover_topics_command(
         console.print(f"[red]Input file not found: {input}[/red]")
         raise typer.Exit(1)
 
+    if dim_reduction not in ("umap", "pca"):
+        console.print(f"[red]Invalid --dim-reduction: {dim_reduction} (expected umap or pca)[/red]")
+        raise typer.Exit(1)
+
     atoms_path = atoms / "atoms.jsonl" if atoms.is_dir() else atoms
     decisions_path = atoms / "decisions.jsonl" if atoms.is_dir() else atoms.parent / "decisions.jsonl"
     questions_path = atoms / "open_questions.jsonl" if atoms.is_dir() else atoms.parent / "open_questions.jsonl"
@@ -65,6 +71,7 @@ def discover_topics_command(
         chunk_tokens=chunk_tokens,
         overlap_tokens=chunk_overlap,
         cache_dir=cache_dir,
+        dim_reduction=dim_reduction,
     )
 
     doc_texts = [documents[conv_id] for conv_id in doc_ids]
@@ -90,7 +97,6 @@ def discover_topics_command(
                     "representative_conversations": [],
                 }
             )
-        from ck_exporter.core.models import Topic
         topics = [Topic(**t) for t in topics]
     else:
         console.print("[bold]Labeling topics with LLM...[/bold]")
@@ -2,7 +2,7 @@
 
 from ck_exporter.core.ports.llm import LLMClient
 from ck_exporter.core.ports.embedder import Embedder
-from ck_exporter.core.ports.atom_extractor import AtomExtractor
+from ck_exporter.core.ports.atom_extractor import AtomExtractor, BatchAtomExtractor
 from ck_exporter.core.ports.topic_labeler import TopicLabeler
 
-__all__ = ["LLMClient", "Embedder", "AtomExtractor", "TopicLabeler"]
+__all__ = ["LLMClient", "Embedder", "AtomExtractor", "BatchAtomExtractor", "TopicLabeler"]
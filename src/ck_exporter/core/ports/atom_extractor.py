@@ -38,3 +38,32 @@ class AtomExtractor(Protocol):
             Each value is a refined/deduplicated list of atom dicts
         """
         ...
+
+
+class BatchAtomExtractor(AtomExtractor, Protocol):
+    """Atom extractor whose Pass 1 requests can be submitted through a batch API."""
+
+    def chunk_request_body(self, chunk_text: str) -> dict[str, Any]:
+        """
+        Build the chat completions request body for a Pass 1 chunk.
+
+        Args:
+            chunk_text: Formatted conversation chunk text
+
+        Returns:
+            Request body for POST /v1/chat/completions
+        """
+        ...
+
+    def parse_chunk_response(self, content: str | None, repair: bool = True) -> dict[str, Any]:
+        """
+        Parse a Pass 1 completion into candidate atoms.
+
+        Args:
+            content: Raw completion text
+            repair: Whether an unparseable completion may be repaired with a live LLM call
+
+        Returns:
+            Dict with keys: "facts", "decisions", "open_questions"
+        """
+        ...
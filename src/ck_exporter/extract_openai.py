@@ -10,9 +10,37 @@ from typing import Callable, Optional
 from ck_exporter.adapters.openrouter_client import make_openrouter_client
 from ck_exporter.bootstrap import build_atom_extractor
 from ck_exporter.pipeline.extract import extract_export as _extract_export
+from ck_exporter.pipeline.extract_batch import extract_export_batch
 
 # Re-export for backward compatibility
-__all__ = ["extract_export", "make_openrouter_client"]
+__all__ = ["extract_export", "make_openrouter_client", "validate_batch_options"]
+
+
+def validate_batch_options(
+    use_openrouter: bool,
+    fast_model: Optional[str] = None,
+    big_model: Optional[str] = None,
+) -> None:
+    """
+    Check that options are usable with the OpenAI Batch API.
+
+    OpenRouter has no batch endpoint, and its default "vendor/model" ids are
+    rejected by OpenAI, so batch runs need OpenAI model ids for both passes.
+
+    Raises:
+        ValueError: If the options cannot be used for a batch run
+    """
+    if use_openrouter:
+        raise ValueError("Batch extraction requires the OpenAI API; pass --no-openrouter")
+    for flag, env_var, model in (
+        ("--fast-model", "CKX_FAST_MODEL", fast_model),
+        ("--big-model", "CKX_BIG_MODEL", big_model),
+    ):
+        model = model or os.getenv(env_var)
+        if not model or "/" in model:
+            raise ValueError(
+                f"Batch extraction needs an OpenAI model id; pass {flag} (e.g. gpt-4o-mini) or set {env_var}"
+            )
 
 
 def extract_export(
@@ -27,6 +55,7 @@ def extract_export(
     conversation_id: Optional[str] = None,
     limit: Optional[int] = None,
     progress_cb: Optional[Callable[[int, int, Optional[dict]], None]] = None,
+    batch: bool = False,
 ) -> None:
     """
     Process export and extract atoms for all conversations using two-pass OpenRouter pipeline.
@@ -36,7 +65,13 @@ def extract_export(
     Accepts either:
     - A top-level list of conversations (standard export format)
     - A single conversation object with mapping/current_node
+
+    With ``batch=True``, Pass 1 runs through the OpenAI Batch API instead of live
+    requests (see ``validate_batch_options`` for the requirements).
     """
+    if batch:
+        validate_batch_options(use_openrouter, fast_model, big_model)
+
     # Set defaults from environment or hardcoded defaults
     max_concurrency = max_concurrency or int(os.getenv("CKX_MAX_CONCURRENCY", "8"))
 
@@ -51,6 +86,19 @@ def extract_export(
         shared_client=shared_client,
     )
 
+    if batch:
+        extract_export_batch(
+            input_path=input_path,
+            atoms_dir=atoms_dir,
+            extractor=extractor,
+            client=shared_client,
+            max_concurrency=max_concurrency,
+            skip_existing=skip_existing,
+            conversation_id=conversation_id,
+            limit=limit,
+        )
+        return
+
     # Delegate to pipeline
     _extract_export(
         input_path=input_path,
@@ -4,13 +4,14 @@ This module provides structured logging with JSON output by default,
 context helpers, and third-party log level controls.
 """
 
-import json
 import logging
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
+from ck_exporter.utils import fast_json
+
 try:
     from rich.logging import RichHandler
 except ImportError:
@@ -19,14 +20,77 @@ except ImportError:
 # Global state to track current logging mode
 _current_mode: Optional[str] = None
 
+# Level names accepted by configure_logging, resolved once at import
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.CRITICAL,
+    "NOTSET": logging.NOTSET,
+}
+
+# Top-level log values passed to the JSON encoder unchanged
+_JSON_NATIVE_TYPES = (str, int, float, bool, type(None), list, dict)
+
+# Noisy third-party loggers quieted by configure_logging
+_THIRD_PARTY_LOGGERS = tuple(
+    logging.getLogger(name)
+    for name in (
+        "bertopic",
+        "hdbscan",
+        "umap",
+        "numba",
+        "openai",
+        "httpx",
+        "urllib3",
+        "httpcore",
+    )
+)
+
+
+# LogRecord attributes that are not user-supplied extras ("event" is emitted separately)
+_RESERVED_LOG_KEYS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "taskName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "event",
+    }
+)
+
 
 class JsonFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        # Timestamp the record's creation time (UTC) rather than reading the clock again
+        created = record.created
         log_data: Dict[str, Any] = {
-            "ts": datetime.utcnow().isoformat() + "Z",
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(created))
+            + f".{int(created % 1 * 1_000_000):06d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -37,32 +101,9 @@ class JsonFormatter(logging.Formatter):
             log_data["event"] = record.event
 
         # Add all extra fields
-        for key, value in record.__dict__.items():
-            if key not in {
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "event",
-            }:
-                log_data[key] = value
+        log_data.update(
+            {key: value for key, value in record.__dict__.items() if key not in _RESERVED_LOG_KEYS}
+        )
 
         # Add exception info if present
         if record.exc_info:
@@ -73,7 +114,17 @@ class JsonFormatter(logging.Formatter):
                 "traceback": self.formatException(record.exc_info) if exc_traceback else None,
             }
 
-        return json.dumps(log_data, ensure_ascii=False)
+        try:
+            return fast_json.dumps(log_data)
+        except TypeError:
+            # Some extra isn't JSON-native (e.g. a Path); stringify those values
+            # only on this slow path so well-typed records never pay for the check
+            return fast_json.dumps(
+                {
+                    key: value if isinstance(value, _JSON_NATIVE_TYPES) else str(value)
+                    for key, value in log_data.items()
+                }
+            )
 
 
 class PlainFormatter(logging.Formatter):
@@ -152,8 +203,8 @@ def configure_logging(
     _current_mode = mode
     
     # Convert level strings to logging constants
-    log_level = getattr(logging, level.upper(), logging.INFO)
-    third_party_log_level = getattr(logging, third_party_level.upper(), logging.WARNING)
+    log_level = _LOG_LEVELS.get(level.upper(), logging.INFO)
+    third_party_log_level = _LOG_LEVELS.get(third_party_level.upper(), logging.WARNING)
 
     # Get root logger
     root_logger = logging.getLogger()
@@ -219,18 +270,7 @@ def configure_logging(
         root_logger.addHandler(handler)
 
     # Configure third-party loggers to be quieter
-    third_party_loggers = [
-        "bertopic",
-        "hdbscan",
-        "umap",
-        "numba",
-        "openai",
-        "httpx",
-        "urllib3",
-        "httpcore",
-    ]
-    for logger_name in third_party_loggers:
-        third_party_logger = logging.getLogger(logger_name)
+    for third_party_logger in _THIRD_PARTY_LOGGERS:
         third_party_logger.setLevel(third_party_log_level)
         # Prevent propagation to root if we want complete control
         # third_party_logger.propagate = False
@@ -1,20 +1,22 @@
 """Multi-label topic assignment for conversations."""
 
-import json
+from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from ck_exporter.adapters.fs_jsonl import read_jsonl as _read_jsonl
 from ck_exporter.core.models import ConversationTopics, TopicAssignment, TopicRegistry
-from ck_exporter.embeddings import EmbeddingClient, cosine_similarity
+from ck_exporter.embeddings import EmbeddingClient
 from ck_exporter.logging import get_logger, with_context
 from ck_exporter.pipeline.io import (
     convert_claude_to_chatgpt,
     is_claude_conversation,
-    load_conversations,
+    iter_conversations,
 )
-from ck_exporter.pipeline.topics import build_conversation_documents, read_jsonl
+from ck_exporter.pipeline.topics import build_conversation_documents
+from ck_exporter.utils import fast_json
 
 logger = get_logger(__name__)
 
@@ -32,12 +34,34 @@ def load_topic_registry(registry_path: Path) -> TopicRegistry:
     if not registry_path.exists():
         raise FileNotFoundError(f"Topic registry not found: {registry_path}")
 
-    with registry_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = fast_json.loads(registry_path.read_bytes())
 
     return TopicRegistry(**data)
 
 
+def _cosine_similarity_matrix(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """
+    Compute cosine similarities between each row of ``vectors`` and each centroid.
+
+    Rows are L2-normalized once and scored with a single float32 matrix product.
+    Scores are clamped to [0, 1] like ``cosine_similarity``; zero vectors score 0.
+
+    Args:
+        vectors: Array of shape (n, dim)
+        centroids: Array of shape (k, dim)
+
+    Returns:
+        Array of shape (n, k)
+    """
+
+    def normalize(matrix: np.ndarray) -> np.ndarray:
+        matrix = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+
+    return np.clip(normalize(vectors) @ normalize(centroids).T, 0.0, 1.0)
+
+
 def assign_topics(
     input_path: Path,
     atoms_path: Path,
@@ -98,11 +122,11 @@ def assign_topics(
         )
         return []
 
-    # Build conversation metadata map (project id/name when available)
+    # Build conversation metadata map (project id/name when available); stream
+    # the conversations since only a few fields of each are kept
     project_meta: Dict[str, Dict[str, str]] = {}
     try:
-        conversations = load_conversations(input_path, limit=limit)
-        for conv in conversations:
+        for conv in iter_conversations(input_path, limit=limit):
             if is_claude_conversation(conv):
                 conv = convert_claude_to_chatgpt(conv)
             conv_id = conv.get("conversation_id") or conv.get("id") or conv.get("uuid", "")
@@ -127,13 +151,10 @@ def assign_topics(
         # Metadata is optional; assignment can proceed without it.
         project_meta = {}
 
-    # Count atoms per conversation for metadata
-    atoms = read_jsonl(atoms_path)
-    atom_counts = {}
-    for atom in atoms:
-        conv_id = atom.get("source_conversation_id", "")
-        if conv_id:
-            atom_counts[conv_id] = atom_counts.get(conv_id, 0) + 1
+    # Count atoms per conversation for metadata, streaming the atoms file
+    atom_counts = Counter(atom.get("source_conversation_id") for atom in _read_jsonl(atoms_path))
+    atom_counts.pop(None, None)
+    atom_counts.pop("", None)
 
     # Generate embeddings for all conversations
     logger.info(
@@ -170,7 +191,7 @@ def assign_topics(
     topic_centroids = {}
     for topic in registry.topics:
         if topic.centroid_embedding:
-            topic_centroids[topic.topic_id] = np.array(topic.centroid_embedding)
+            topic_centroids[topic.topic_id] = np.asarray(topic.centroid_embedding, dtype=np.float32)
 
     if not topic_centroids:
         logger.error(
@@ -179,6 +200,28 @@ def assign_topics(
         )
         return []
 
+    # First registry entry wins for duplicate topic IDs
+    topic_names: Dict[int, str] = {}
+    for topic in registry.topics:
+        topic_names.setdefault(topic.topic_id, topic.name)
+
+    # Centroids whose dimension doesn't match the conversation embeddings can't be scored
+    embedding_dim = conv_embeddings.shape[1] if conv_embeddings.ndim == 2 else None
+    topic_ids = []
+    for topic_id, centroid in topic_centroids.items():
+        if centroid.shape != (embedding_dim,):
+            logger.warning(
+                "Error computing similarity for topic",
+                extra={
+                    "event": "assignment.similarity.error",
+                    "topic_id": topic_id,
+                    "centroid_shape": list(centroid.shape),
+                    "embedding_dim": embedding_dim,
+                },
+            )
+            continue
+        topic_ids.append(topic_id)
+
     # Assign topics to each conversation
     assignments = []
     logger.info(
@@ -186,33 +229,32 @@ def assign_topics(
         extra={"event": "assignment.start"},
     )
 
+    if topic_ids:
+        # Score every conversation against every topic in one matrix product,
+        # then rank and threshold with array operations instead of per-pair loops
+        scores = _cosine_similarity_matrix(
+            conv_embeddings, np.vstack([topic_centroids[topic_id] for topic_id in topic_ids])
+        )
+        # Stable sort keeps registry order among equal scores
+        order = np.argsort(-scores, axis=1, kind="stable")
+        sorted_scores = np.take_along_axis(scores, order, axis=1)
+        primary_scores = sorted_scores[:, :1]
+
+        # Secondary topics: score >= secondary_threshold and within 0.25 of primary
+        secondary_mask = (sorted_scores >= secondary_threshold) & (primary_scores - sorted_scores <= 0.25)
+        secondary_mask[:, 0] = False
+
+        # Review flag: primary score is low, or the runner-up is very close to primary
+        review_flags = primary_scores[:, 0] < primary_threshold
+        if len(topic_ids) > 1:
+            runner_up = sorted_scores[:, 1]
+            review_flags |= (runner_up >= secondary_threshold) & (primary_scores[:, 0] - runner_up < 0.08)
+
     for i, conv_id in enumerate(conv_ids):
-        conv_embedding = conv_embeddings[i]
         title = titles.get(conv_id, "Untitled Conversation")
         meta = project_meta.get(conv_id, {})
 
-        # Compute similarity to all topic centroids
-        similarities = []
-        for topic_id, centroid in topic_centroids.items():
-            try:
-                score = cosine_similarity(conv_embedding, centroid)
-                topic_name = next((t.name for t in registry.topics if t.topic_id == topic_id), f"Topic {topic_id}")
-                similarities.append((topic_id, topic_name, score))
-            except Exception as e:
-                logger.warning(
-                    "Error computing similarity for topic",
-                    extra={
-                        "event": "assignment.similarity.error",
-                        "topic_id": topic_id,
-                    },
-                    exc_info=True,
-                )
-                continue
-
-        # Sort by score descending
-        similarities.sort(key=lambda x: x[2], reverse=True)
-
-        if not similarities:
+        if not topic_ids:
             # No valid similarities, create empty assignment
             assignments.append(
                 ConversationTopics(
@@ -228,37 +270,25 @@ def assign_topics(
             continue
 
         # Primary topic: always assign top-scoring topic
-        primary_id, primary_name, primary_score = similarities[0]
+        primary_id = topic_ids[order[i, 0]]
         topic_assignments = [
             TopicAssignment(
                 topic_id=primary_id,
-                name=primary_name,
-                score=primary_score,
+                name=topic_names.get(primary_id, f"Topic {primary_id}"),
+                score=float(sorted_scores[i, 0]),
                 rank="primary",
             )
         ]
-
-        # Secondary topics: any topic with score >= secondary_threshold
-        # and within 0.25 of primary score
-        for topic_id, topic_name, score in similarities[1:]:
-            if score >= secondary_threshold and (primary_score - score) <= 0.25:
-                topic_assignments.append(
-                    TopicAssignment(
-                        topic_id=topic_id,
-                        name=topic_name,
-                        score=score,
-                        rank="secondary",
-                    )
+        for rank_idx in np.flatnonzero(secondary_mask[i]):
+            topic_id = topic_ids[order[i, rank_idx]]
+            topic_assignments.append(
+                TopicAssignment(
+                    topic_id=topic_id,
+                    name=topic_names.get(topic_id, f"Topic {topic_id}"),
+                    score=float(sorted_scores[i, rank_idx]),
+                    rank="secondary",
                 )
-
-        # Review flag: set if primary score is low or if secondary is very close to primary
-        review_flag = False
-        if primary_score < primary_threshold:
-            review_flag = True
-        elif len(similarities) > 1:
-            secondary_score = similarities[1][2]
-            if secondary_score >= secondary_threshold and (primary_score - secondary_score) < 0.08:
-                review_flag = True
+            )
 
         assignments.append(
             ConversationTopics(
@@ -268,9 +298,9 @@ def assign_topics(
                 project_name=meta.get("project_name"),
                 topics=topic_assignments,
                 atom_count=atom_counts.get(conv_id, 0),
-                review_flag=review_flag,
-            )
+                review_flag=bool(review_flags[i]),
             )
+        )
 
     logger.info(
         "Assigned topics to conversations",
@@ -292,11 +322,10 @@ def save_assignments(assignments: List[ConversationTopics], output_path: Path) -
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Serialize every assignment first, then hand the file one batch of lines
+    lines = [fast_json.dumps(assignment.model_dump(exclude_none=True)) + "\n" for assignment in assignments]
     with output_path.open("w", encoding="utf-8") as f:
-        for assignment in assignments:
-            # Convert to dict for JSON serialization
-            assignment_dict = assignment.model_dump(exclude_none=True)
-            f.write(json.dumps(assignment_dict, ensure_ascii=False) + "\n")
+        f.writelines(lines)
 
     logger.info(
         "Saved assignments",
@@ -311,20 +340,22 @@ def save_assignments(assignments: List[ConversationTopics], output_path: Path) -
     review_items = [a for a in assignments if a.review_flag]
     if review_items:
         review_path = output_path.parent / "review_queue.jsonl"
+        review_lines = []
+        for assignment in review_items:
+            primary = next((t for t in assignment.topics if t.rank == "primary"), None)
+            review_dict = {
+                "conversation_id": assignment.conversation_id,
+                "title": assignment.title,
+                "project_id": assignment.project_id,
+                "project_name": assignment.project_name,
+                "primary_topic": primary.name if primary else "None",
+                "primary_score": primary.score if primary else 0.0,
+                "reason": "low_confidence" if (primary and primary.score < 0.60) else "ambiguous",
+            }
+            # Keep output tidy for non-Claude exports
+            review_lines.append(fast_json.dumps({k: v for k, v in review_dict.items() if v is not None}) + "\n")
         with review_path.open("w", encoding="utf-8") as f:
-            for assignment in review_items:
-                primary = next((t for t in assignment.topics if t.rank == "primary"), None)
-                review_dict = {
-                    "conversation_id": assignment.conversation_id,
-                    "title": assignment.title,
-                    "project_id": assignment.project_id,
-                    "project_name": assignment.project_name,
-                    "primary_topic": primary.name if primary else "None",
-                    "primary_score": primary.score if primary else 0.0,
-                    "reason": "low_confidence" if (primary and primary.score < 0.60) else "ambiguous",
-                }
-                # Keep output tidy for non-Claude exports
-                f.write(json.dumps({k: v for k, v in review_dict.items() if v is not None}, ensure_ascii=False) + "\n")
+            f.writelines(review_lines)
 
         logger.info(
             "Created review queue",
@@ -1,14 +1,17 @@
 """Compile documentation from knowledge atoms."""
 
-import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from ck_exporter.adapters.fs_jsonl import load_atoms_jsonl
 from ck_exporter.logging import get_logger, should_show_progress, with_context
 
 logger = get_logger(__name__)
@@ -16,6 +19,45 @@ logger = get_logger(__name__)
 # Template directory (relative to templates folder in src/ck_exporter)
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
+# Filename sanitization tables (built once; sanitize_filename runs per ADR).
+# Invalid characters map to hyphens in a single C-level str.translate pass.
+_INVALID_FILENAME_TRANS = str.maketrans(
+    {c: "-" for c in '<>:"/\\|?*' + "".join(map(chr, range(0x20)))}
+)
+_WHITESPACE_OR_HYPHEN_RUN = re.compile(r'[\s\-]+')
+
+# Topics that go into architecture.md
+_ARCH_TOPICS = frozenset({"architecture", "pipeline", "storage", "integrations"})
+
+# One Jinja2 environment per process; templates never change during a run, so
+# auto_reload is off and each template is parsed at most once.
+_ENV: Optional[Environment] = (
+    Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+    )
+    if TEMPLATE_DIR.exists()
+    else None
+)
+
+
+@lru_cache(maxsize=None)
+def _get_templates() -> Tuple[Optional[Template], Optional[Template], Optional[Template]]:
+    """
+    Return the (cached) overview, architecture and ADR templates.
+
+    All three are None when the templates directory is missing, in which case
+    only the inline ADR fallback is written.
+    """
+    if _ENV is None:
+        return None, None, None
+    return (
+        _ENV.get_template("overview.md.j2"),
+        _ENV.get_template("architecture.md.j2"),
+        _ENV.get_template("adr.md.j2"),
+    )
+
 
 def sanitize_filename(name: str) -> str:
     """
@@ -41,10 +83,10 @@ def sanitize_filename(name: str) -> str:
         return "unnamed"
     
     # Replace invalid characters with hyphens
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '-', name)
+    sanitized = name.translate(_INVALID_FILENAME_TRANS)
     
     # Replace multiple consecutive spaces/hyphens with single hyphen
-    sanitized = re.sub(r'[\s\-]+', '-', sanitized)
+    sanitized = _WHITESPACE_OR_HYPHEN_RUN.sub('-', sanitized)
     
     # Remove leading/trailing dots, spaces, and hyphens
     sanitized = sanitized.strip('. -')
@@ -56,24 +98,6 @@ def sanitize_filename(name: str) -> str:
     return sanitized if sanitized else "unnamed"
 
 
-def load_atoms_jsonl(file_path: Path) -> List[Dict[str, Any]]:
-    """Load atoms from a JSONL file."""
-    if not file_path.exists():
-        return []
-
-    atoms = []
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    atoms.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-
-    return atoms
-
-
 def group_atoms_by_topic(atoms: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     """Group atoms by topic."""
     grouped = {}
@@ -85,6 +109,54 @@ def group_atoms_by_topic(atoms: List[Dict[str, Any]]) -> Dict[str, List[Dict[str
     return grouped
 
 
+def _write_adr(
+    adr_output_dir: Path,
+    conversation_id: str,
+    adr_template: Optional[Template],
+    idx: int,
+    decision: Dict[str, Any],
+) -> None:
+    """Render one decision as an ADR markdown file."""
+    # Sanitize topic for use in filename (once; shared by both render paths)
+    topic_safe = sanitize_filename(decision.get('topic', 'decision'))
+    adr_path = adr_output_dir / f"ADR-{idx:04d}-{topic_safe}.md"
+
+    if adr_template:
+        adr_content = adr_template.render(
+            adr_number=idx,
+            decision=decision,
+            conversation_id=conversation_id,
+        )
+    else:
+        # Fallback: simple markdown
+        adr_content = f"""# ADR {idx:04d}: {decision.get('statement', 'Decision')}
+
+**Status**: {decision.get('status', 'active')}
+**Topic**: {decision.get('topic', 'uncategorized')}
+
+## Decision
+
+{decision.get('statement', '')}
+
+## Rationale
+
+{decision.get('rationale', 'Not provided')}
+
+## Alternatives Considered
+
+{chr(10).join(f"- {alt}" for alt in decision.get('alternatives', [])) or 'None listed'}
+
+## Consequences
+
+{decision.get('consequences', 'Not specified')}
+
+## Evidence
+
+{chr(10).join(f"- Message ID: {e.get('message_id')} at {e.get('time_iso')}" for e in decision.get('evidence', []))}
+"""
+    adr_path.write_text(adr_content, encoding="utf-8")
+
+
 def compile_conversation_docs(
     conversation_id: str,
     atoms_dir: Path,
@@ -108,22 +180,13 @@ def compile_conversation_docs(
         )
         return
 
-    # Setup Jinja2 environment
-    if TEMPLATE_DIR.exists():
-        env = Environment(
-            loader=FileSystemLoader(str(TEMPLATE_DIR)),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
-    else:
-        # Fallback: create basic templates inline
-        env = Environment(loader=FileSystemLoader("."))
+    overview_template, arch_template, adr_template = _get_templates()
 
     # Create output directory
     conv_output_dir = output_dir / conversation_id
     conv_output_dir.mkdir(parents=True, exist_ok=True)
 
     # Compile overview
-    overview_template = env.get_template("overview.md.j2") if TEMPLATE_DIR.exists() else None
     if overview_template:
         overview_content = overview_template.render(
             conversation_id=conversation_id,
@@ -134,64 +197,28 @@ def compile_conversation_docs(
         )
         (conv_output_dir / "overview.md").write_text(overview_content, encoding="utf-8")
 
-    # Compile architecture doc
-    arch_facts = [f for f in facts if f.get("topic", "").lower() in ["architecture", "pipeline", "storage", "integrations"]]
-    if arch_facts:
-        arch_template = env.get_template("architecture.md.j2") if TEMPLATE_DIR.exists() else None
-        if arch_template:
-            arch_content = arch_template.render(
-                conversation_id=conversation_id,
-                facts=arch_facts,
-                decisions=[d for d in decisions if d.get("topic", "").lower() in ["architecture", "pipeline", "storage", "integrations"]],
-            )
-            (conv_output_dir / "architecture.md").write_text(arch_content, encoding="utf-8")
+    # Compile architecture doc; partition facts and decisions in a single loop
+    arch_facts: List[Dict[str, Any]] = []
+    arch_decisions: List[Dict[str, Any]] = []
+    for atoms, arch_atoms in ((facts, arch_facts), (decisions, arch_decisions)):
+        for atom in atoms:
+            if (atom.get("topic") or "").lower() in _ARCH_TOPICS:
+                arch_atoms.append(atom)
+    if arch_facts and arch_template:
+        arch_content = arch_template.render(
+            conversation_id=conversation_id,
+            facts=arch_facts,
+            decisions=arch_decisions,
+        )
+        (conv_output_dir / "architecture.md").write_text(arch_content, encoding="utf-8")
 
     # Compile ADRs
     adr_output_dir = output_dir / "decisions" / conversation_id
     adr_output_dir.mkdir(parents=True, exist_ok=True)
 
-    adr_template = env.get_template("adr.md.j2") if TEMPLATE_DIR.exists() else None
+    # Written serially: _compile_all already overlaps I/O across conversations
     for idx, decision in enumerate(decisions, start=1):
-        # Sanitize topic for use in filename
-        topic_safe = sanitize_filename(decision.get('topic', 'decision'))
-        
-        if adr_template:
-            adr_content = adr_template.render(
-                adr_number=idx,
-                decision=decision,
-                conversation_id=conversation_id,
-            )
-            adr_path = adr_output_dir / f"ADR-{idx:04d}-{topic_safe}.md"
-            adr_path.write_text(adr_content, encoding="utf-8")
-        else:
-            # Fallback: simple markdown
-            adr_path = adr_output_dir / f"ADR-{idx:04d}-{topic_safe}.md"
-            adr_content = f"""# ADR {idx:04d}: {decision.get('statement', 'Decision')}
-
-**Status**: {decision.get('status', 'active')}
-**Topic**: {decision.get('topic', 'uncategorized')}
-
-## Decision
-
-{decision.get('statement', '')}
-
-## Rationale
-
-{decision.get('rationale', 'Not provided')}
-
-## Alternatives Considered
-
-{chr(10).join(f"- {alt}" for alt in decision.get('alternatives', [])) or 'None listed'}
-
-## Consequences
-
-{decision.get('consequences', 'Not specified')}
-
-## Evidence
-
-{chr(10).join(f"- Message ID: {e.get('message_id')} at {e.get('time_iso')}" for e in decision.get('evidence', []))}
-"""
-            adr_path.write_text(adr_content, encoding="utf-8")
+        _write_adr(adr_output_dir, conversation_id, adr_template, idx, decision)
 
     conv_logger.info(
         "Compiled docs",
@@ -204,6 +231,51 @@ def compile_conversation_docs(
     )
 
 
+def _compile_all(conversation_ids: List[str], atoms_dir: Path, output_dir: Path) -> Iterator[str]:
+    """
+    Compile docs for each conversation, yielding conversation IDs as they finish.
+
+    Conversations are independent, so with CKX_COMPILE_WORKERS > 1 (default: 8)
+    they are compiled in a thread pool; results arrive in completion order. The
+    work is mostly file I/O, and threads keep log records flowing to the
+    handlers configured in this process (e.g. the run-all dashboard). Errors are
+    logged per conversation and don't stop the run.
+    """
+    workers = int(os.getenv("CKX_COMPILE_WORKERS", "8"))
+    workers = max(1, min(workers, len(conversation_ids)))
+
+    def log_error(conv_id: str, exc: BaseException) -> None:
+        logger.error(
+            "Error compiling conversation",
+            exc_info=exc,
+            extra={
+                "event": "compile.conversation.error",
+                "conversation_id": conv_id,
+            },
+        )
+
+    if workers == 1:
+        for conv_id in conversation_ids:
+            try:
+                compile_conversation_docs(conv_id, atoms_dir, output_dir)
+            except Exception as e:
+                log_error(conv_id, e)
+            yield conv_id
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(compile_conversation_docs, conv_id, atoms_dir, output_dir): conv_id
+            for conv_id in conversation_ids
+        }
+        for future in as_completed(futures):
+            conv_id = futures[future]
+            exc = future.exception()
+            if exc is not None:
+                log_error(conv_id, exc)
+            yield conv_id
+
+
 def compile_docs(
     atoms_dir: Path,
     output_dir: Path,
@@ -220,9 +292,12 @@ def compile_docs(
     if not atoms_dir.exists():
         raise ValueError(f"Atoms directory not found: {atoms_dir}")
 
-    conversation_dirs = [d for d in atoms_dir.iterdir() if d.is_dir()]
+    # os.scandir exposes the entry type from the directory listing itself,
+    # avoiding a stat() per entry that Path.iterdir() + is_dir() would need.
+    with os.scandir(atoms_dir) as entries:
+        conversation_ids = [entry.name for entry in entries if entry.is_dir()]
 
-    if not conversation_dirs:
+    if not conversation_ids:
         logger.warning(
             "No conversation directories found",
             extra={"event": "compile.export.empty"},
@@ -233,13 +308,15 @@ def compile_docs(
         "Compiling docs",
         extra={
             "event": "compile.export.start",
-            "num_conversations": len(conversation_dirs),
+            "num_conversations": len(conversation_ids),
         },
     )
 
     # Notify progress callback of total
     if progress_cb:
-        progress_cb(0, len(conversation_dirs), {})
+        progress_cb(0, len(conversation_ids), {})
+
+    compiled = _compile_all(conversation_ids, atoms_dir, output_dir)
 
     if should_show_progress() and not progress_cb:
         console = Console(stderr=True)
@@ -248,40 +325,15 @@ def compile_docs(
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
-            task = progress.add_task("Compiling docs...", total=len(conversation_dirs))
-
-            for conv_dir in conversation_dirs:
-                conv_id = conv_dir.name
-                try:
-                    compile_conversation_docs(conv_id, atoms_dir, output_dir)
-                except Exception as e:
-                    logger.exception(
-                        "Error compiling conversation",
-                        extra={
-                            "event": "compile.conversation.error",
-                            "conversation_id": conv_id,
-                        },
-                    )
+            task = progress.add_task("Compiling docs...", total=len(conversation_ids))
 
+            for _ in compiled:
                 progress.advance(task)
     else:
         # Non-interactive mode or dashboard mode: process without progress bar
-        completed = 0
-        for conv_dir in conversation_dirs:
-            conv_id = conv_dir.name
-            try:
-                compile_conversation_docs(conv_id, atoms_dir, output_dir)
-            except Exception as e:
-                logger.exception(
-                    "Error compiling conversation",
-                    extra={
-                        "event": "compile.conversation.error",
-                        "conversation_id": conv_id,
-                    },
-                )
-            completed += 1
+        for completed, conv_id in enumerate(compiled, start=1):
             if progress_cb:
-                progress_cb(completed, len(conversation_dirs), {"conversation_id": conv_id})
+                progress_cb(completed, len(conversation_ids), {"conversation_id": conv_id})
 
     logger.info(
         "Compilation complete",
@@ -1,11 +1,13 @@
 """Consolidate per-conversation outputs into project-wide knowledge packet."""
 
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ck_exporter.logging import get_logger
+from ck_exporter.utils import fast_json
 
 logger = get_logger(__name__)
 
@@ -31,7 +33,9 @@ def _iter_conversation_dirs(atoms_dir: Path) -> List[Path]:
     """Get all conversation directories from atoms directory."""
     if not atoms_dir.exists():
         return []
-    return sorted([p for p in atoms_dir.iterdir() if p.is_dir()], key=lambda p: p.name)
+    with os.scandir(atoms_dir) as entries:
+        names = sorted(entry.name for entry in entries if entry.is_dir())
+    return [atoms_dir / name for name in names]
 
 
 def _read_jsonl(path: Path) -> Iterable[Dict[str, Any]]:
@@ -44,7 +48,7 @@ def _read_jsonl(path: Path) -> Iterable[Dict[str, Any]]:
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = fast_json.loads(line)
             except json.JSONDecodeError:
                 continue
             if isinstance(obj, dict):
@@ -100,7 +104,7 @@ def _write_jsonl(path: Path, rows: List[Dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
         for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            f.write(fast_json.dumps(row) + "\n")
 
 
 def _concat_markdown_files(md_files: List[Path], out_path: Path) -> None:
@@ -22,18 +22,12 @@ logger = get_logger(__name__)
 
 def format_chunk_for_extraction(messages: list[dict[str, Any]]) -> str:
     """Format a message chunk as text for extraction."""
-    lines = []
-    for msg in messages:
-        role = msg.get("role", "unknown")
-        text = msg.get("text", "")
-        time_iso = msg.get("time_iso", "")
-        msg_id = msg.get("id", "")
-
-        lines.append(f"[{role.upper()}] {time_iso} (ID: {msg_id})")
-        lines.append(text)
-        lines.append("")
-
-    return "\n".join(lines)
+    # Each message renders as its header line, its text, then a blank separator line
+    return "\n".join(
+        f"[{msg.get('role', 'unknown').upper()}] {msg.get('time_iso', '')} (ID: {msg.get('id', '')})\n"
+        f"{msg.get('text', '')}\n"
+        for msg in messages
+    )
 
 
 def _conversation_outputs_exist(conv_id: str, atoms_dir: Path) -> bool:
@@ -201,6 +195,18 @@ def extract_conversation(
             all_candidates["decisions"].extend(result.get("decisions", []))
             all_candidates["open_questions"].extend(result.get("open_questions", []))
 
+    _refine_and_write(conversation, conv_id, all_candidates, atoms_dir, extractor, conv_logger)
+
+
+def _refine_and_write(
+    conversation: dict[str, Any],
+    conv_id: str,
+    all_candidates: dict[str, list[dict[str, Any]]],
+    atoms_dir: Path,
+    extractor: AtomExtractor,
+    conv_logger: Any,
+) -> None:
+    """Run Pass 2 over a conversation's candidates and write the final JSONL files."""
     # Pass 2: Refine and consolidate all candidates
     conv_logger.info(
         "Pass 2: Refining candidates",
@@ -251,31 +257,14 @@ def extract_conversation(
     )
 
 
-def extract_export(
+def _select_conversations(
     input_path: Path,
-    evidence_dir: Path,
     atoms_dir: Path,
-    extractor: AtomExtractor,
-    max_concurrency: int = 8,
     skip_existing: bool = True,
     conversation_id: Optional[str] = None,
     limit: Optional[int] = None,
-    progress_cb: Optional[Callable[[int, int, Optional[dict]], None]] = None,
-) -> None:
-    """
-    Process export(s) and extract atoms for all conversations.
-
-    Args:
-        input_path: Path to conversation export JSON or directory of per-conversation JSON files
-        evidence_dir: Directory with linearized markdown evidence
-        atoms_dir: Output directory for atoms JSONL files
-        extractor: Atom extractor implementation
-        max_concurrency: Maximum concurrent conversations
-        skip_existing: Skip conversations with existing outputs
-        conversation_id: Optional filter to single conversation ID
-        limit: Optional limit on number of conversations to process
-        progress_cb: Optional callback(completed, total, context) for progress updates
-    """
+) -> list[dict[str, Any]]:
+    """Load conversations and apply the conversation-id and skip-existing filters."""
     logger.info(
         "Loading export",
         extra={
@@ -327,6 +316,38 @@ def extract_export(
                 },
             )
 
+    return conversations
+
+
+def extract_export(
+    input_path: Path,
+    evidence_dir: Path,
+    atoms_dir: Path,
+    extractor: AtomExtractor,
+    max_concurrency: int = 8,
+    skip_existing: bool = True,
+    conversation_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    progress_cb: Optional[Callable[[int, int, Optional[dict]], None]] = None,
+) -> None:
+    """
+    Process export(s) and extract atoms for all conversations.
+
+    Args:
+        input_path: Path to conversation export JSON or directory of per-conversation JSON files
+        evidence_dir: Directory with linearized markdown evidence
+        atoms_dir: Output directory for atoms JSONL files
+        extractor: Atom extractor implementation
+        max_concurrency: Maximum concurrent conversations
+        skip_existing: Skip conversations with existing outputs
+        conversation_id: Optional filter to single conversation ID
+        limit: Optional limit on number of conversations to process
+        progress_cb: Optional callback(completed, total, context) for progress updates
+    """
+    conversations = _select_conversations(
+        input_path, atoms_dir, skip_existing=skip_existing, conversation_id=conversation_id, limit=limit
+    )
+
     if not conversations:
         logger.warning(
             "No conversations to process",
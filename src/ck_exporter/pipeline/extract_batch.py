@@ -0,0 +1,312 @@
+"""Extraction pipeline variant that runs Pass 1 through the OpenAI Batch API."""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Optional
+
+import typer
+
+from ck_exporter.core.ports.atom_extractor import BatchAtomExtractor
+from ck_exporter.logging import get_logger, with_context
+from ck_exporter.pipeline.extract import (
+    _refine_and_write,
+    _select_conversations,
+    format_chunk_for_extraction,
+)
+from ck_exporter.pipeline.io import get_conversation_id
+from ck_exporter.pipeline.linearize import linearize_conversation
+from ck_exporter.utils import fast_json
+from ck_exporter.utils.chunking import chunk_messages
+
+logger = get_logger(__name__)
+
+# OpenAI caps a single batch at 50,000 requests and its input file at 200 MB;
+# leave some headroom under the byte limit
+_BATCH_MAX_REQUESTS = 50_000
+_BATCH_MAX_BYTES = 190 * 1024 * 1024
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def build_batch_requests(
+    conversations: list[dict[str, Any]],
+    extractor: BatchAtomExtractor,
+    max_chunk_tokens: int = 8000,
+) -> list[dict[str, Any]]:
+    """
+    Build one Batch API request line per Pass 1 chunk.
+
+    Each request's ``custom_id`` is ``"<conversation_id>:<chunk_index>"`` so
+    results can be fanned back out to their conversation in chunk order.
+
+    Args:
+        conversations: Conversations to extract
+        extractor: Atom extractor providing ``chunk_request_body``
+        max_chunk_tokens: Maximum tokens per chunk
+
+    Returns:
+        List of request dicts, ready to be written as JSONL
+    """
+    requests = []
+    for conversation in conversations:
+        conv_id = get_conversation_id(conversation)
+        if not conv_id:
+            continue
+        messages = linearize_conversation(conversation)
+        chunks = chunk_messages(messages, max_tokens=max_chunk_tokens, model="gpt-4")
+        for idx, chunk in enumerate(chunks):
+            requests.append(
+                {
+                    "custom_id": f"{conv_id}:{idx}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": extractor.chunk_request_body(format_chunk_for_extraction(chunk)),
+                }
+            )
+    return requests
+
+
+def parse_batch_output(
+    output_lines: list[str],
+    extractor: BatchAtomExtractor,
+    repair: bool = False,
+) -> dict[str, dict[str, list[dict[str, Any]]]]:
+    """
+    Parse Batch API output lines into per-conversation Pass 1 candidates.
+
+    Chunk results are merged in chunk order, matching ``extract_conversation``.
+    Failed requests and unparseable completions contribute no candidates.
+    Completions wrapped in markdown code blocks are still recovered; the LLM
+    repair fallback is off by default because it makes one live, serial call per
+    bad completion.
+
+    Args:
+        output_lines: Lines of the batch output file
+        extractor: Atom extractor providing ``parse_chunk_response``
+        repair: Let the extractor repair unparseable completions with live LLM calls
+
+    Returns:
+        Dict mapping conversation ID to its merged candidates
+    """
+    chunk_results: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+    for line in output_lines:
+        if not line.strip():
+            continue
+        try:
+            record = fast_json.loads(line)
+            conv_id, _, idx = record["custom_id"].rpartition(":")
+            chunk_idx = int(idx)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                logger.warning(
+                    "Batch request failed",
+                    extra={
+                        "event": "extract.batch.request_failed",
+                        "conversation_id": conv_id,
+                        "chunk_num": chunk_idx + 1,
+                        "error": record.get("error") or (response.get("body") or {}).get("error"),
+                    },
+                )
+                continue
+            content = response["body"]["choices"][0]["message"].get("content")
+            result = extractor.parse_chunk_response(content, repair=repair)
+        except Exception:
+            logger.exception(
+                "Error parsing batch result",
+                extra={
+                    "event": "extract.batch.result_error",
+                    "response_preview": line[:200],
+                },
+            )
+            continue
+        chunk_results.setdefault(conv_id, []).append((chunk_idx, result))
+
+    candidates: dict[str, dict[str, list[dict[str, Any]]]] = {}
+    for conv_id, results in chunk_results.items():
+        results.sort(key=lambda x: x[0])
+        merged = {"facts": [], "decisions": [], "open_questions": []}
+        for _, result in results:
+            merged["facts"].extend(result.get("facts", []))
+            merged["decisions"].extend(result.get("decisions", []))
+            merged["open_questions"].extend(result.get("open_questions", []))
+        candidates[conv_id] = merged
+    return candidates
+
+
+def _split_payloads(requests: list[dict[str, Any]]) -> list[tuple[bytes, int]]:
+    """Serialize requests into JSONL payloads within the per-batch request and byte limits."""
+    payloads = []
+    lines: list[bytes] = []
+    size = 0
+    for request in requests:
+        line = (fast_json.dumps(request) + "\n").encode("utf-8")
+        if lines and (len(lines) >= _BATCH_MAX_REQUESTS or size + len(line) > _BATCH_MAX_BYTES):
+            payloads.append((b"".join(lines), len(lines)))
+            lines = []
+            size = 0
+        lines.append(line)
+        size += len(line)
+    if lines:
+        payloads.append((b"".join(lines), len(lines)))
+    return payloads
+
+
+def _submit_batch(client: Any, payload: bytes, num_requests: int) -> Any:
+    """Upload one JSONL payload and create a batch for it."""
+    input_file = client.files.create(file=("pass1.jsonl", payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(
+        "Batch submitted",
+        extra={
+            "event": "extract.batch.submitted",
+            "batch_id": batch.id,
+            "num_requests": num_requests,
+        },
+    )
+    return batch
+
+
+def _wait_for_batches(client: Any, batches: list[Any], poll_interval: float) -> list[Any]:
+    """Poll all submitted batches together until each reaches a terminal status."""
+    while any(batch.status not in _BATCH_TERMINAL_STATUSES for batch in batches):
+        time.sleep(poll_interval)
+        for i, batch in enumerate(batches):
+            if batch.status in _BATCH_TERMINAL_STATUSES:
+                continue
+            batches[i] = client.batches.retrieve(batch.id)
+            logger.debug(
+                "Batch status",
+                extra={"event": "extract.batch.poll", "batch_id": batch.id, "status": batches[i].status},
+            )
+    return batches
+
+
+def _download_results(client: Any, batch: Any) -> list[str]:
+    """
+    Download a finished batch's output and error files as JSONL lines.
+
+    Requests that failed at the batch level appear only in the error file, so
+    its lines are returned too and reported by ``parse_batch_output``.
+    """
+    if batch.status != "completed":
+        logger.warning(
+            "Batch did not complete",
+            extra={"event": "extract.batch.incomplete", "batch_id": batch.id, "status": batch.status},
+        )
+    lines: list[str] = []
+    for file_id in (batch.output_file_id, getattr(batch, "error_file_id", None)):
+        if file_id:
+            lines.extend(client.files.content(file_id).text.splitlines())
+    if not lines:
+        logger.error(
+            "Batch produced no output",
+            extra={"event": "extract.batch.error", "batch_id": batch.id, "status": batch.status},
+        )
+    return lines
+
+
+def extract_export_batch(
+    input_path: Path,
+    atoms_dir: Path,
+    extractor: BatchAtomExtractor,
+    client: Any,
+    max_concurrency: int = 8,
+    skip_existing: bool = True,
+    conversation_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    max_chunk_tokens: int = 8000,
+    poll_interval: Optional[float] = None,
+) -> None:
+    """
+    Extract atoms for all conversations, running Pass 1 through the Batch API.
+
+    All Pass 1 chunk requests are submitted as offline batches, which trades
+    latency for the Batch API's discounted pricing and server-side
+    parallelism. Once the batches finish, Pass 2 refinement runs per
+    conversation as in ``extract_export``.
+
+    Args:
+        input_path: Path to conversation export JSON or directory of per-conversation JSON files
+        atoms_dir: Output directory for atoms JSONL files
+        extractor: Atom extractor implementation (must build/parse batch requests)
+        client: OpenAI client for the files and batches endpoints
+        max_concurrency: Maximum concurrent Pass 2 refinements
+        skip_existing: Skip conversations with existing outputs
+        conversation_id: Optional filter to single conversation ID
+        limit: Optional limit on number of conversations to process
+        max_chunk_tokens: Maximum tokens per chunk
+        poll_interval: Seconds between batch status checks (default: CKX_BATCH_POLL_SECONDS or 30)
+    """
+    if poll_interval is None:
+        poll_interval = float(os.getenv("CKX_BATCH_POLL_SECONDS", "30"))
+
+    conversations = _select_conversations(
+        input_path, atoms_dir, skip_existing=skip_existing, conversation_id=conversation_id, limit=limit
+    )
+    if not conversations:
+        logger.warning(
+            "No conversations to process",
+            extra={"event": "extract.export.empty"},
+        )
+        return
+
+    requests = build_batch_requests(conversations, extractor, max_chunk_tokens=max_chunk_tokens)
+    logger.info(
+        "Processing conversations via Batch API",
+        extra={
+            "event": "extract.batch.start",
+            "num_conversations": len(conversations),
+            "num_requests": len(requests),
+        },
+    )
+
+    # Submit every batch up front so they run concurrently, then poll them together
+    batches = [
+        _submit_batch(client, payload, num_requests)
+        for payload, num_requests in _split_payloads(requests)
+    ]
+    batches = _wait_for_batches(client, batches, poll_interval)
+
+    output_lines: list[str] = []
+    for batch in batches:
+        output_lines.extend(_download_results(client, batch))
+    if not output_lines:
+        raise typer.Exit(1)
+    candidates = parse_batch_output(output_lines, extractor)
+
+    def refine(conversation: dict[str, Any]) -> None:
+        conv_id = get_conversation_id(conversation)
+        all_candidates = candidates.get(
+            conv_id, {"facts": [], "decisions": [], "open_questions": []}
+        )
+        conv_logger = with_context(logger, conversation_id=conv_id)
+        _refine_and_write(conversation, conv_id, all_candidates, atoms_dir, extractor, conv_logger)
+
+    # Conversations without messages produced no requests; like extract_conversation, skip them
+    requested_ids = {request["custom_id"].rpartition(":")[0] for request in requests}
+    convs_with_ids = [conv for conv in conversations if get_conversation_id(conv) in requested_ids]
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = {
+            executor.submit(refine, conv): get_conversation_id(conv) for conv in convs_with_ids
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:
+                logger.exception(
+                    "Error processing conversation",
+                    extra={
+                        "event": "extract.conversation.error",
+                        "conversation_id": futures[future],
+                    },
+                )
+
+    logger.info(
+        "Batch extraction complete",
+        extra={"event": "extract.batch.complete", "num_conversations": len(convs_with_ids)},
+    )
@@ -4,6 +4,7 @@ from ck_exporter.pipeline.io.load import (
     convert_claude_to_chatgpt,
     is_chatgpt_single_conversation,
     is_claude_conversation,
+    iter_conversations,
     load_conversations,
     parse_iso_timestamp,
 )
@@ -22,6 +23,7 @@ from ck_exporter.pipeline.io.schema_helpers import (
 
 __all__ = [
     "load_conversations",
+    "iter_conversations",
     "convert_claude_to_chatgpt",
     "is_claude_conversation",
     "is_chatgpt_single_conversation",
@@ -7,10 +7,19 @@ Supports:
 - Directory inputs: a folder containing many per-conversation JSON files (e.g. chatgpt-conversations/)
 """
 
-import json
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Literal, Optional
+
+from ck_exporter.utils import fast_json
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 
 def is_chatgpt_single_conversation(obj: Any) -> bool:
@@ -27,18 +36,48 @@ def is_claude_conversation(obj: Any) -> bool:
     return obj.get("platform") == "CLAUDE_AI" and isinstance(obj.get("chat_messages"), list)
 
 
+def _classify_conversation(obj: Any) -> Optional[Literal["claude", "chatgpt"]]:
+    """
+    Classify a decoded JSON value as a Claude export, a ChatGPT conversation, or neither.
+
+    Equivalent to ``is_claude_conversation`` then ``is_chatgpt_single_conversation``,
+    with a single type check.
+    """
+    if not isinstance(obj, dict):
+        return None
+    if obj.get("platform") == "CLAUDE_AI" and isinstance(obj.get("chat_messages"), list):
+        return "claude"
+    if "mapping" in obj and "current_node" in obj:
+        return "chatgpt"
+    return None
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" (and most ISO 8601 forms) natively
+    _fromisoformat = datetime.fromisoformat
+else:
+
+    def _fromisoformat(iso_str: str) -> datetime:
+        if iso_str.endswith("Z"):
+            iso_str = iso_str[:-1] + "+00:00"
+        return datetime.fromisoformat(iso_str)
+
+
 def parse_iso_timestamp(iso_str: str) -> float | None:
     """Parse ISO timestamp string to epoch seconds float."""
     if not iso_str:
         return None
     try:
         # Handle ISO format with timezone (e.g., "2025-12-18T18:06:43.449478+00:00")
-        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-        return dt.timestamp()
-    except (ValueError, AttributeError):
+        return _fromisoformat(iso_str).timestamp()
+    except (ValueError, TypeError, AttributeError):
         return None
 
 
+# Claude sender -> ChatGPT author role (unknown senders map to "system")
+_CLAUDE_SENDER_ROLES = {"human": "user", "assistant": "assistant"}
+
+
 def convert_claude_to_chatgpt(claude_conv: dict) -> dict:
     """
     Convert Claude conversation export to ChatGPT-style conversation dict.
@@ -72,19 +111,18 @@ def convert_claude_to_chatgpt(claude_conv: dict) -> dict:
     mapping = {}
     previous_uuid = None
 
-    for msg in chat_messages:
-        msg_uuid = msg.get("uuid")
-        if not msg_uuid:
-            continue  # Skip messages without UUID
+    # Skip messages without UUID up front so the loop body is straight-line
+    valid_messages = [msg for msg in chat_messages if msg.get("uuid")]
+
+    for msg in valid_messages:
+        msg_uuid = msg["uuid"]
 
-        # Map sender to role
-        sender = msg.get("sender", "").lower()
-        if sender == "human":
-            role = "user"
-        elif sender == "assistant":
-            role = "assistant"
-        else:
-            role = "system"  # Unknown sender types -> system
+        # Map sender to role; lowercase only when the sender isn't already canonical
+        sender = msg.get("sender")
+        role = _CLAUDE_SENDER_ROLES.get(sender)
+        if role is None:
+            sender = sender.lower() if isinstance(sender, str) else ""
+            role = _CLAUDE_SENDER_ROLES.get(sender, "system")  # Unknown sender types -> system
 
         # Parse timestamp
         created_at = msg.get("created_at")
@@ -148,12 +186,74 @@ def _list_json_files(input_dir: Path) -> list[Path]:
     JSON file per conversation.
     """
     # Prefer direct children first (common case), then fall back to recursive search.
-    direct = sorted(p for p in input_dir.glob("*.json") if p.is_file())
+    # A single os.scandir pass reads the entry type from the directory listing,
+    # so there is no per-file stat() as with glob() + is_file().
+    with os.scandir(input_dir) as entries:
+        direct = sorted(
+            entry.name for entry in entries if entry.name.endswith(".json") and entry.is_file()
+        )
     if direct:
-        return direct
+        return [input_dir / name for name in direct]
     return sorted(p for p in input_dir.rglob("*.json") if p.is_file())
 
 
+def _normalize_list_item(item: Any, index: int, input_path: Path) -> Optional[dict]:
+    """
+    Normalize one entry of a top-level conversation list.
+
+    Returns None for entries that aren't objects.
+    """
+    if not isinstance(item, dict):
+        return None
+
+    kind = _classify_conversation(item)
+
+    # Convert Claude exports even when embedded in a list
+    if kind == "claude":
+        return convert_claude_to_chatgpt(item)
+
+    # If it's a single ChatGPT conversation object, ensure it has an ID
+    if kind == "chatgpt":
+        if not item.get("id") and not item.get("conversation_id"):
+            # Prefer Claude-style uuid if present; otherwise fall back to index-based ID
+            item["conversation_id"] = item.get("uuid") or f"{input_path.stem}_{index}"
+        return item
+
+    # Otherwise, include as-is (downstream may skip if no ID)
+    return item
+
+
+def _is_list_file(input_path: Path) -> bool:
+    """Check whether a JSON file's top-level value is an array (first non-whitespace byte)."""
+    with input_path.open("rb") as f:
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                return False
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1] == b"["
+
+
+def _stream_list_file(input_path: Path) -> Iterator[dict]:
+    """
+    Yield normalized conversations from a top-level JSON array one element at a time.
+
+    Uses ijson so a multi-gigabyte ``conversations.json`` export is never held
+    in memory as a whole; only the conversation being yielded is materialized.
+    """
+    with input_path.open("rb") as f:
+        try:
+            # use_float keeps create_time etc. as floats instead of Decimals, like json.loads
+            for i, item in enumerate(ijson.items(f, "item", use_float=True)):
+                conv = _normalize_list_item(item, i, input_path)
+                if conv is not None:
+                    yield conv
+        except ijson.JSONError as e:
+            # Match the ValueError (JSONDecodeError) raised by the non-streaming path
+            raise ValueError(f"Invalid JSON in {input_path}: {e}") from e
+
+
 def _load_conversations_file(input_path: Path) -> List[dict]:
     """
     Load and normalize conversations from a single JSON file.
@@ -170,41 +270,25 @@ def _load_conversations_file(input_path: Path) -> List[dict]:
 
     Raises ValueError if input format is not recognized.
     """
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = fast_json.loads(input_path.read_bytes())
 
     # Case 1: Already a list (standard export format OR list of Claude exports)
     if isinstance(data, list):
-        normalized: List[dict] = []
-        for i, item in enumerate(data):
-            if not isinstance(item, dict):
-                continue
+        return [
+            conv
+            for conv in (_normalize_list_item(item, i, input_path) for i, item in enumerate(data))
+            if conv is not None
+        ]
 
-            # Convert Claude exports even when embedded in a list
-            if is_claude_conversation(item):
-                normalized.append(convert_claude_to_chatgpt(item))
-                continue
-
-            # If it's a single ChatGPT conversation object, ensure it has an ID
-            if is_chatgpt_single_conversation(item):
-                if not item.get("id") and not item.get("conversation_id"):
-                    # Prefer Claude-style uuid if present; otherwise fall back to index-based ID
-                    item["conversation_id"] = item.get("uuid") or f"{input_path.stem}_{i}"
-                normalized.append(item)
-                continue
-
-            # Otherwise, include as-is (downstream may skip if no ID)
-            normalized.append(item)
-
-        return normalized
+    kind = _classify_conversation(data)
 
     # Case 2: Claude conversation export
-    if is_claude_conversation(data):
+    if kind == "claude":
         converted = convert_claude_to_chatgpt(data)
         return [converted]
 
     # Case 3: Single ChatGPT conversation dict
-    if is_chatgpt_single_conversation(data):
+    if kind == "chatgpt":
         # Ensure conversation_id exists
         if not data.get("id") and not data.get("conversation_id"):
             # Use filename stem as conversation_id
@@ -222,25 +306,17 @@ def _load_conversations_file(input_path: Path) -> List[dict]:
     )
 
 
-def load_conversations(input_path: Path, limit: Optional[int] = None) -> List[dict]:
+def iter_conversations(input_path: Path, limit: Optional[int] = None) -> Iterator[dict]:
     """
-    Load and normalize conversations from a JSON file OR directory.
-
-    Supports:
-    - List of conversations (standard ChatGPT export format)
-    - Single ChatGPT conversation dict (with mapping/current_node)
-    - Claude conversation export (with platform="CLAUDE_AI" and chat_messages[])
-    - A directory containing many `.json` files, each containing any of the above
-      (common for per-conversation exports like `chatgpt-conversations/`)
+    Yield normalized conversations from a JSON file OR directory, one file at a time.
 
-    For single ChatGPT conversations missing id/conversation_id, injects conversation_id
-    based on filename stem.
+    Same inputs, normalization and limit semantics as ``load_conversations``, but
+    for directory inputs only one file's conversations are held in memory at once.
+    Callers that only need a few fields per conversation should prefer this.
 
     Args:
         input_path: Path to JSON file or directory containing JSON files
-        limit: Optional limit on number of conversations to return. For directories,
-               selects first N files by sorted filename (deterministic). For list exports,
-               returns first N conversations after normalization.
+        limit: Optional limit on number of conversations to yield
 
     Raises ValueError if input format is not recognized.
     """
@@ -249,27 +325,58 @@ def load_conversations(input_path: Path, limit: Optional[int] = None) -> List[di
         if not json_files:
             raise ValueError(f"No .json files found in directory: {input_path}")
 
-        conversations: List[dict] = []
+        count = 0
         for p in json_files:
             # Stop if we've reached the limit
-            if limit is not None and len(conversations) >= limit:
-                break
+            if limit is not None and count >= limit:
+                return
 
             # Be liberal in what we accept: skip files that aren't a supported conversation format.
             try:
                 file_conversations = _load_conversations_file(p)
-                conversations.extend(file_conversations)
-
-                # If limit is set and we've exceeded it, trim to limit
-                if limit is not None and len(conversations) > limit:
-                    conversations = conversations[:limit]
-                    break
             except ValueError:
                 continue
-        return conversations
+
+            for conv in file_conversations:
+                if limit is not None and count >= limit:
+                    return
+                yield conv
+                count += 1
+        return
+
+    # Large single-file exports are a top-level array; stream it when ijson is installed
+    if HAS_IJSON and _is_list_file(input_path):
+        for count, conv in enumerate(_stream_list_file(input_path)):
+            if limit is not None and count >= limit:
+                return
+            yield conv
+        return
 
     # For single file inputs, load and optionally limit
     conversations = _load_conversations_file(input_path)
-    if limit is not None:
-        return conversations[:limit]
-    return conversations
+    yield from (conversations[:limit] if limit is not None else conversations)
+
+
+def load_conversations(input_path: Path, limit: Optional[int] = None) -> List[dict]:
+    """
+    Load and normalize conversations from a JSON file OR directory.
+
+    Supports:
+    - List of conversations (standard ChatGPT export format)
+    - Single ChatGPT conversation dict (with mapping/current_node)
+    - Claude conversation export (with platform="CLAUDE_AI" and chat_messages[])
+    - A directory containing many `.json` files, each containing any of the above
+      (common for per-conversation exports like `chatgpt-conversations/`)
+
+    For single ChatGPT conversations missing id/conversation_id, injects conversation_id
+    based on filename stem.
+
+    Args:
+        input_path: Path to JSON file or directory containing JSON files
+        limit: Optional limit on number of conversations to return. For directories,
+               selects first N files by sorted filename (deterministic). For list exports,
+               returns first N conversations after normalization.
+
+    Raises ValueError if input format is not recognized.
+    """
+    return list(iter_conversations(input_path, limit=limit))
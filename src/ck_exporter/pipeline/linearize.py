@@ -1,12 +1,10 @@
 """Linearize ChatGPT conversation export into ordered message list."""
 
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
 from ck_exporter.logging import get_logger, should_show_progress, with_context
 from ck_exporter.pipeline.io import (
     get_current_node,
@@ -23,6 +21,25 @@ from ck_exporter.pipeline.io import (
 
 logger = get_logger(__name__)
 
+# The spinner only redraws a few times a second, so advance it in batches
+_PROGRESS_FLUSH_EVERY = 64
+_PROGRESS_FLUSH_SECONDS = 0.5
+
+
+def _walk_parent_chain_checked(mapping: Dict[str, Any], current: str) -> List[Any]:
+    """Walk the parent chain of a cyclic mapping, stopping at the first repeated node."""
+    path_messages = []
+    node_id = current
+    visited = set()
+
+    while node_id and node_id not in visited:
+        visited.add(node_id)
+        node = mapping.get(node_id, {})
+        path_messages.append(node.get("message"))
+        node_id = node.get("parent")
+
+    return path_messages
+
 
 def linearize_conversation(conversation: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -36,25 +53,30 @@ def linearize_conversation(conversation: Dict[str, Any]) -> List[Dict[str, Any]]
     if not current:
         return []
 
-    # Walk parent chain to root
-    path = []
+    # Walk parent chain to root, picking up each node's message on the way so
+    # the mapping is only looked up once per node. A valid mapping is a tree,
+    # so the chain can't be longer than the mapping; only a malformed (cyclic)
+    # mapping exhausts the step budget.
+    path_messages = []
     node_id = current
-    visited = set()
+    steps_left = len(mapping) + 1
 
-    while node_id and node_id not in visited:
-        visited.add(node_id)
-        path.append(node_id)
+    while node_id and steps_left:
+        steps_left -= 1
         node = mapping.get(node_id, {})
+        path_messages.append(node.get("message"))
         node_id = node.get("parent")
 
-    # Reverse to get chronological order
-    path.reverse()
+    if node_id:
+        logger.warning(
+            "Cycle in conversation mapping",
+            extra={"event": "linearize.conversation.cycle", "conversation_id": conversation.get("id")},
+        )
+        path_messages = _walk_parent_chain_checked(mapping, current)
 
-    # Extract messages
+    # Extract messages in chronological order (root first)
     messages = []
-    for node_id in path:
-        node = mapping.get(node_id, {})
-        message = node.get("message")
+    for message in reversed(path_messages):
         if not message:
             continue
 
@@ -91,30 +113,29 @@ def write_conversation_markdown(
     output_path = output_dir / conversation_id / "conversation.md"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Assemble the whole document and write it in one call
+    parts = [f"# {title}\n\n", f"Conversation ID: `{conversation_id}`\n\n"]
+    if project_name and project_id:
+        parts.append(f"Project: **{project_name}** (`{project_id}`)\n\n")
+    elif project_name:
+        parts.append(f"Project: **{project_name}**\n\n")
+    elif project_id:
+        parts.append(f"Project ID: `{project_id}`\n\n")
+    parts.append("---\n\n")
+
+    for msg in messages:
+        time_iso = msg.get("time_iso", "")
+        msg_id = msg.get("id", "")
+
+        parts.append(f"## {msg['role'].title()}\n\n")
+        if time_iso:
+            parts.append(f"**Time**: {time_iso}\n\n")
+        if msg_id:
+            parts.append(f"**Message ID**: `{msg_id}`\n\n")
+        parts.append(f"{msg['text']}\n\n---\n\n")
+
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(f"# {title}\n\n")
-        f.write(f"Conversation ID: `{conversation_id}`\n\n")
-        if project_name and project_id:
-            f.write(f"Project: **{project_name}** (`{project_id}`)\n\n")
-        elif project_name:
-            f.write(f"Project: **{project_name}**\n\n")
-        elif project_id:
-            f.write(f"Project ID: `{project_id}`\n\n")
-        f.write("---\n\n")
-
-        for msg in messages:
-            role = msg["role"]
-            text = msg["text"]
-            time_iso = msg.get("time_iso", "")
-            msg_id = msg.get("id", "")
-
-            f.write(f"## {role.title()}\n\n")
-            if time_iso:
-                f.write(f"**Time**: {time_iso}\n\n")
-            if msg_id:
-                f.write(f"**Message ID**: `{msg_id}`\n\n")
-            f.write(f"{text}\n\n")
-            f.write("---\n\n")
+        f.write("".join(parts))
 
     return output_path
 
@@ -160,6 +181,10 @@ def linearize_export(
         progress_cb(0, len(conversations), {})
 
     if should_show_progress() and not progress_cb:
+        # Rich is only needed for the interactive spinner
+        from rich.console import Console
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         console = Console(stderr=True)
         with Progress(
             SpinnerColumn(),
@@ -167,6 +192,9 @@ def linearize_export(
             console=console,
         ) as progress:
             task = progress.add_task("Linearizing conversations...", total=len(conversations))
+            completed = 0
+            pending = 0
+            last_flush = time.monotonic()
 
             for conv in conversations:
                 conv_id = conv.get("id") or conv.get("conversation_id")
@@ -175,7 +203,7 @@ def linearize_export(
                         "Skipping conversation without ID",
                         extra={"event": "linearize.conversation.skipped", "reason": "no_id"},
                     )
-                    progress.advance(task)
+                    pending += 1
                     continue
 
                 conv_logger = with_context(logger, conversation_id=conv_id)
@@ -207,10 +235,16 @@ def linearize_export(
                         extra={"event": "linearize.conversation.skipped", "reason": "no_messages"},
                     )
 
-                progress.advance(task)
-                # Update progress callback if provided
-                if progress_cb:
-                    progress_cb(progress.tasks[task].completed, len(conversations), {"conversation_id": conv_id})
+                completed += 1
+                pending += 1
+                now = time.monotonic()
+                if pending >= _PROGRESS_FLUSH_EVERY or now - last_flush >= _PROGRESS_FLUSH_SECONDS:
+                    progress.advance(task, advance=pending)
+                    pending = 0
+                    last_flush = now
+            if pending:
+                progress.advance(task, advance=pending)
+            num_conversations = completed
     else:
         # Non-interactive mode or dashboard mode: process without progress bar
         completed = 0
@@ -256,8 +290,9 @@ def linearize_export(
             completed += 1
             if progress_cb:
                 progress_cb(completed, len(conversations), {"conversation_id": conv_id})
+        num_conversations = completed
 
     logger.info(
         "Linearization complete",
-        extra={"event": "linearize.export.complete"},
+        extra={"event": "linearize.export.complete", "num_conversations": num_conversations},
     )
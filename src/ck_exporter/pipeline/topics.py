@@ -1,7 +1,7 @@
 """Topic discovery and labeling pipeline orchestration."""
 
-import json
 import logging
+import os
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -20,11 +20,15 @@ from ck_exporter.logging import get_logger, should_show_progress
 from ck_exporter.pipeline.io import (
     convert_claude_to_chatgpt,
     is_claude_conversation,
-    load_conversations,
+    iter_conversations,
 )
+from ck_exporter.utils import fast_json
 
 logger = get_logger(__name__)
 
+# CKX_TOPIC_GPU values that turn the cuML backend off
+_FALSE_VALUES = frozenset({"false", "0", "no", "off"})
+
 
 def read_jsonl(path: Path) -> List[Dict[str, Any]]:
     """Read JSONL file and return list of objects."""
@@ -53,11 +57,11 @@ def build_conversation_documents(
         - conversation_documents: dict mapping conversation_id to document text
         - conversation_titles: dict mapping conversation_id to title
     """
-    # Load conversations to get titles
-    conversations = load_conversations(input_path, limit=limit)
+    # Stream conversations to get titles; only the small per-conversation fields
+    # are kept, so full message mappings are never all in memory at once
     conversation_titles = {}
     conversation_projects: Dict[str, str] = {}
-    for conv in conversations:
+    for conv in iter_conversations(input_path, limit=limit):
         # Handle Claude conversations that might not be converted yet
         if is_claude_conversation(conv):
             conv = convert_claude_to_chatgpt(conv)
@@ -140,6 +144,53 @@ def build_conversation_documents(
     return conversation_documents, conversation_titles
 
 
+def _build_cluster_models(dim_reduction: str = "umap") -> Tuple[Any, Any]:
+    """
+    Build the dimensionality-reduction and clustering models for BERTopic.
+
+    Uses RAPIDS cuML's GPU UMAP/HDBSCAN when cuML is installed (it only runs on
+    CUDA machines), unless CKX_TOPIC_GPU is false/0/no/off. Otherwise uses the CPU
+    umap-learn/hdbscan implementations with the same parameters.
+
+    Args:
+        dim_reduction: "umap" (default) or "pca" (faster and deterministic, with
+            coarser clusters)
+
+    Returns:
+        Tuple of (dim_reduction_model, hdbscan_model)
+    """
+    if dim_reduction not in ("umap", "pca"):
+        raise ValueError(f"Unsupported dim reduction: {dim_reduction}. Use 'umap' or 'pca'.")
+
+    umap_params = dict(n_neighbors=15, n_components=5, min_dist=0.0, metric="cosine", random_state=42)
+    hdbscan_params = dict(min_cluster_size=2, metric="euclidean", cluster_selection_method="eom")
+
+    if os.getenv("CKX_TOPIC_GPU", "auto").lower() not in _FALSE_VALUES:
+        try:
+            from cuml import cluster as cuml_cluster
+            from cuml import decomposition as cuml_decomposition
+            from cuml import manifold as cuml_manifold
+        except ImportError:
+            pass
+        else:
+            logger.info(
+                "Using cuML GPU backends for dim reduction/HDBSCAN",
+                extra={"event": "topics.bertopic.backend", "backend": "cuml", "dim_reduction": dim_reduction},
+            )
+            if dim_reduction == "pca":
+                reducer = cuml_decomposition.PCA(n_components=5)
+            else:
+                reducer = cuml_manifold.UMAP(**umap_params)
+            return reducer, cuml_cluster.HDBSCAN(**hdbscan_params)
+
+    if dim_reduction == "pca":
+        from sklearn.decomposition import PCA
+
+        return PCA(n_components=5, random_state=42), HDBSCAN(**hdbscan_params)
+
+    return UMAP(**umap_params), HDBSCAN(**hdbscan_params)
+
+
 def discover_topics(
     documents: Dict[str, str],
     embedder: Embedder,
@@ -148,6 +199,7 @@ def discover_topics(
     chunk_tokens: int = 600,
     overlap_tokens: int = 80,
     cache_dir: Optional[Path] = None,
+    dim_reduction: str = "umap",
 ) -> Tuple[BERTopic, np.ndarray, List[str]]:
     """
     Discover topics using BERTopic with pre-computed embeddings.
@@ -160,6 +212,7 @@ def discover_topics(
         chunk_tokens: Maximum tokens per chunk when pooling (default 600)
         overlap_tokens: Token overlap between chunks when pooling (default 80)
         cache_dir: Optional directory for caching embeddings
+        dim_reduction: "umap" (default) or "pca" for faster, deterministic clustering
 
     Returns:
         Tuple of (bertopic_model, embeddings, doc_ids)
@@ -205,14 +258,14 @@ def discover_topics(
     bertopic_logger = logging.getLogger("bertopic")
     verbose = bertopic_logger.level <= logging.INFO
 
-    umap_model = UMAP(n_neighbors=15, n_components=5, min_dist=0.0, metric="cosine", random_state=42)
-    hdbscan_model = HDBSCAN(min_cluster_size=2, metric="euclidean", cluster_selection_method="eom")
+    umap_model, hdbscan_model = _build_cluster_models(dim_reduction)
 
     logger.info(
         "Configuring BERTopic",
         extra={
             "event": "topics.bertopic.config",
             "target_topics": target_topics,
+            "dim_reduction": dim_reduction,
             "verbose": verbose,
         },
     )
@@ -384,6 +437,17 @@ def label_topics_with_llm(
     return discovered_topics
 
 
+def _to_float16_list(vector: np.ndarray) -> List[float]:
+    """
+    Round a vector to float16 precision for storage in the topic registry.
+
+    Each value is written as the shortest decimal that round-trips through
+    float16 (about 4 significant digits), which roughly halves the registry
+    size. The precision loss is negligible for cosine-similarity scoring.
+    """
+    return [float(str(x)) for x in vector.astype(np.float16)]
+
+
 def save_topic_registry(
     topics: List[Topic],
     topic_model: BERTopic,
@@ -394,7 +458,7 @@ def save_topic_registry(
     output_path: Path,
 ) -> None:
     """
-    Save topic registry with centroid embeddings.
+    Save topic registry with centroid embeddings (stored at float16 precision).
 
     Args:
         topics: List of Topic objects
@@ -414,7 +478,7 @@ def save_topic_registry(
         if topic_emb_indices:
             topic_embeddings = embeddings[topic_emb_indices]
             centroid = np.mean(topic_embeddings, axis=0)
-            topic_centroids[topic_id] = centroid.tolist()
+            topic_centroids[topic_id] = _to_float16_list(centroid)
 
     # Add centroid embeddings to topics
     for topic in topics:
@@ -431,8 +495,7 @@ def save_topic_registry(
     )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(registry.model_dump(), f, indent=2, ensure_ascii=False)
+    output_path.write_text(fast_json.dumps(registry.model_dump(), pretty=True), encoding="utf-8")
 
     logger.info(
         "Saved topic registry",
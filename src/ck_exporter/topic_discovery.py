@@ -40,6 +40,7 @@ def discover_topics(
     chunk_tokens: int = 600,
     overlap_tokens: int = 80,
     cache_dir: Optional[Path] = None,
+    dim_reduction: str = "umap",
 ) -> Tuple[BERTopic, np.ndarray, List[str]]:
     """
     Discover topics using BERTopic with pre-computed embeddings.
@@ -55,6 +56,7 @@ def discover_topics(
         chunk_tokens: Maximum tokens per chunk when pooling (default 600)
         overlap_tokens: Token overlap between chunks when pooling (default 80)
         cache_dir: Optional directory for caching embeddings
+        dim_reduction: "umap" (default) or "pca" for faster, deterministic clustering
 
     Returns:
         Tuple of (bertopic_model, embeddings, doc_ids)
@@ -76,6 +78,7 @@ def discover_topics(
         chunk_tokens=chunk_tokens,
         overlap_tokens=overlap_tokens,
         cache_dir=cache_dir,
+        dim_reduction=dim_reduction,
     )
 
 
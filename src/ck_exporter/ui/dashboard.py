@@ -40,6 +40,9 @@ class StepStatus:
 class DashboardLogHandler(logging.Handler):
     """Log handler that captures logs into a ring buffer for dashboard display."""
 
+    # Sentinel so callers can recognize dashboard handlers with a single getattr
+    _ck_dashboard = True
+
     def __init__(self, ring_buffer_size: int = 100):
         super().__init__()
         self.ring_buffer: Deque[str] = deque(maxlen=ring_buffer_size)
@@ -3,7 +3,8 @@
 from ck_exporter.utils.chunking import (
     chunk_messages,
     chunk_text,
+    chunk_texts_batch,
     estimate_tokens,
 )
 
-__all__ = ["chunk_text", "chunk_messages", "estimate_tokens"]
+__all__ = ["chunk_text", "chunk_texts_batch", "chunk_messages", "estimate_tokens"]
@@ -1,5 +1,6 @@
 """Text chunking utilities for conversation processing."""
 
+from functools import lru_cache
 from typing import List, Optional
 
 try:
@@ -8,15 +9,55 @@ try:
 except ImportError:
     HAS_TIKTOKEN = False
 
+# Sentence boundaries tried (in order) when looking for a chunk break point
+_SENTENCE_BREAKS: tuple[str, ...] = (".\n\n", ".\n", ". ", "!\n\n", "!\n", "! ", "?\n\n", "?\n", "? ")
+
+
+# Model name -> tiktoken encoding name. Unmapped models (e.g. z-ai/glm-4.7) get
+# no encoding and use the character estimate, as they did with encoding_for_model.
+_MODEL_TO_ENCODING: dict[str, str] = {
+    "gpt-3.5-turbo": "cl100k_base",
+    "gpt-4": "cl100k_base",
+    "gpt-4-turbo": "cl100k_base",
+    "gpt-4o": "o200k_base",
+    "gpt-4o-mini": "o200k_base",
+    "gpt-4.1": "o200k_base",
+    "gpt-5": "o200k_base",
+    "gpt-5.2": "o200k_base",
+    "text-embedding-3-small": "cl100k_base",
+    "text-embedding-3-large": "cl100k_base",
+}
+
+# Texts encoded per encode_ordinary_batch call in chunk_texts_batch
+_ENCODE_BATCH_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """
+    Return the (cached) tiktoken encoding for a model, or None if unavailable.
+
+    Provider prefixes like ``openai/`` are ignored. Models missing from
+    ``_MODEL_TO_ENCODING`` return None. A failed load (e.g. the BPE file can't
+    be downloaded) is cached as None so callers fall back to the character
+    estimate instead of retrying on every call.
+    """
+    if not HAS_TIKTOKEN:
+        return None
+    encoding_name = _MODEL_TO_ENCODING.get(model.rsplit("/", 1)[-1])
+    if encoding_name is None:
+        return None
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception:
+        return None
+
 
 def estimate_tokens(text: str, model: str = "gpt-5.2") -> int:
     """Estimate token count for text."""
-    if HAS_TIKTOKEN:
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-            return len(encoding.encode(text))
-        except Exception:
-            pass
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode_ordinary(text))
 
     # Fallback: rough estimate (1 token ≈ 4 characters)
     return len(text) // 4
@@ -46,21 +87,76 @@ def chunk_text(
     # Estimate total tokens
     total_tokens = estimate_tokens(text, model)
 
+    return _split_text(text, total_tokens, max_tokens, overlap_tokens)
+
+
+def chunk_texts_batch(
+    texts: List[str],
+    max_tokens: int = 8000,
+    overlap_tokens: int = 200,
+    model: str = "gpt-5.2",
+    num_threads: int = 8,
+) -> List[List[str]]:
+    """
+    Chunk many texts at once, tokenizing them in a single batched call.
+
+    Token counting dominates ``chunk_text`` for large corpora; here texts are
+    encoded in slices with tiktoken's ``encode_ordinary_batch``, which runs on
+    a thread pool outside the GIL. Chunk boundaries are identical to calling
+    ``chunk_text`` on each text.
+
+    Args:
+        texts: Texts to chunk
+        max_tokens: Maximum tokens per chunk
+        overlap_tokens: Token overlap between chunks
+        model: Model name for tokenization
+        num_threads: Threads used by tiktoken for batch encoding
+
+    Returns:
+        List of chunk lists, one per input text (in input order)
+    """
+    if not texts:
+        return []
+
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        # Encode in bounded slices: only the counts are kept, so each slice's
+        # token lists can be freed before the next one is encoded.
+        token_counts = [
+            len(tokens)
+            for start in range(0, len(texts), _ENCODE_BATCH_SIZE)
+            for tokens in encoding.encode_ordinary_batch(
+                texts[start : start + _ENCODE_BATCH_SIZE], num_threads=num_threads
+            )
+        ]
+    else:
+        token_counts = [len(text) // 4 for text in texts]
+
+    return [
+        _split_text(text, total_tokens, max_tokens, overlap_tokens) if text.strip() else []
+        for text, total_tokens in zip(texts, token_counts)
+    ]
+
+
+def _split_text(text: str, total_tokens: int, max_tokens: int, overlap_tokens: int) -> List[str]:
+    """Split non-empty text into chunks, given its precomputed token count."""
     if total_tokens <= max_tokens:
         return [text]
 
     chunks = []
     current_pos = 0
     text_length = len(text)
+    window_chars = max_tokens * 4  # Rough char estimate
+    overlap_chars = overlap_tokens * 4
 
     while current_pos < text_length:
         # Try to find a good break point
-        end_pos = min(current_pos + max_tokens * 4, text_length)  # Rough char estimate
+        end_pos = min(current_pos + window_chars, text_length)
 
         # If not at end, try to break at sentence boundary
         if end_pos < text_length:
             # Look for sentence endings
-            for punct in [".\n\n", ".\n", ". ", "!\n\n", "!\n", "! ", "?\n\n", "?\n", "? "]:
+            for punct in _SENTENCE_BREAKS:
                 last_break = text.rfind(punct, current_pos, end_pos)
                 if last_break > current_pos:
                     end_pos = last_break + len(punct)
@@ -73,7 +169,13 @@ def chunk_text(
         # Move forward with overlap
         if end_pos >= text_length:
             break
-        current_pos = max(current_pos + 1, end_pos - overlap_tokens * 4)
+        next_pos = end_pos - overlap_chars
+        if next_pos <= current_pos:
+            # The overlap covers the whole chunk: advance by at least half a
+            # window (or the whole chunk, if shorter) so a large overlap can't
+            # degrade into one-character steps and a quadratic number of chunks.
+            next_pos = current_pos + max(1, min(window_chars // 2, end_pos - current_pos))
+        current_pos = next_pos
 
     return chunks
 
@@ -0,0 +1,56 @@
+"""JSON encode/decode helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises ``json.JSONDecodeError`` on invalid input with either backend
+    (``orjson.JSONDecodeError`` is a subclass of it).
+
+    Args:
+        data: JSON text as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize an object to a compact, single-line JSON string (non-ASCII kept as-is).
+
+    Falls back to the stdlib encoder for values orjson can't handle (e.g. ints
+    wider than 64 bits).
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent with two spaces instead of emitting a single line
+
+    Returns:
+        JSON string without a trailing newline
+    """
+    if HAS_ORJSON:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else _ORJSON_OPTIONS
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
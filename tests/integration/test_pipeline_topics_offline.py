@@ -5,18 +5,30 @@ to work properly. For smaller datasets, UMAP's spectral layout algorithm fails.
 """
 
 import json
+import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from types import ModuleType, SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
 from bertopic import BERTopic
+from hdbscan import HDBSCAN
+from sklearn.decomposition import PCA
+from umap import UMAP
 
 from ck_exporter.core.ports.embedder import Embedder
 from ck_exporter.core.ports.topic_labeler import TopicLabeler
-from ck_exporter.pipeline.topics import discover_topics, label_topics_with_llm, save_topic_registry
+from ck_exporter.pipeline.compile import compile_docs
+from ck_exporter.pipeline.topics import (
+    _build_cluster_models,
+    _to_float16_list,
+    discover_topics,
+    label_topics_with_llm,
+    save_topic_registry,
+)
 
 
 class FakeEmbedder:
@@ -193,3 +205,110 @@ def test_save_topic_registry_creates_file(
     assert "topics" in registry_data
     assert len(registry_data["topics"]) == len(topics)
     assert registry_data["embedding_model"] == "test-model"
+
+    # Centroids are stored at float16 precision and reload to the float16 rounding
+    # of the float64 document mean
+    labels = np.asarray(topics_out)
+    for topic in registry_data["topics"]:
+        centroid = np.array(topic["centroid_embedding"])
+        expected = embeddings[labels == topic["topic_id"]].mean(axis=0)
+        assert np.allclose(centroid, expected, rtol=1e-3, atol=1e-4)
+        assert np.array_equal(centroid.astype(np.float16), expected.astype(np.float16))
+
+
+def test_to_float16_list_writes_shortest_decimals():
+    """Centroid values are written as the shortest decimal for their float16 rounding."""
+    vector = np.array([0.1, 1 / 3, 1.0, -2.5e-4, 123.456])
+
+    assert _to_float16_list(vector) == [0.1, 0.3333, 1.0, -0.00025, 123.44]
+
+
+def test_compile_docs_after_topic_discovery(
+    fake_embedder: Embedder, sample_documents: dict[str, str], tmp_path: Path, monkeypatch
+):
+    """Test that parallel doc compilation works after topics were fitted in the same process.
+
+    UMAP/HDBSCAN leave numba and OpenMP threads running; forking compile workers
+    from such a process used to hang the interpreter at exit.
+    """
+    monkeypatch.setenv("CKX_COMPILE_WORKERS", "2")
+    discover_topics(
+        documents=sample_documents,
+        embedder=fake_embedder,
+        target_topics=3,
+        use_pooling=False,
+    )
+
+    atoms_dir = tmp_path / "_atoms"
+    conv_ids = sorted(sample_documents)[:3]
+    for conv_id in conv_ids:
+        conv_dir = atoms_dir / conv_id
+        conv_dir.mkdir(parents=True)
+        fact = {"type": "fact", "topic": "architecture", "statement": f"Fact for {conv_id}"}
+        (conv_dir / "facts.jsonl").write_text(json.dumps(fact) + "\n", encoding="utf-8")
+
+    compile_docs(atoms_dir, tmp_path / "docs")
+
+    for conv_id in conv_ids:
+        assert (tmp_path / "docs" / conv_id / "overview.md").exists()
+
+
+class FakeCumlModel:
+    """Stand-in for a cuML estimator; records its constructor arguments."""
+
+    def __init__(self, **kwargs: Any):
+        self.kwargs = kwargs
+
+
+def _fake_cuml() -> ModuleType:
+    """Build a stand-in for the cuml package exposing the classes the pipeline uses."""
+    cuml = ModuleType("cuml")
+    cuml.cluster = SimpleNamespace(HDBSCAN=type("CumlHDBSCAN", (FakeCumlModel,), {}))
+    cuml.decomposition = SimpleNamespace(PCA=type("CumlPCA", (FakeCumlModel,), {}))
+    cuml.manifold = SimpleNamespace(UMAP=type("CumlUMAP", (FakeCumlModel,), {}))
+    return cuml
+
+
+@pytest.mark.parametrize("gpu_setting", ["auto", "false", "0", "no", "OFF"])
+def test_build_cluster_models_gpu_toggle(gpu_setting: str, monkeypatch):
+    """Test that cuML is used when importable unless CKX_TOPIC_GPU turns it off."""
+    monkeypatch.setitem(sys.modules, "cuml", _fake_cuml())
+    monkeypatch.setenv("CKX_TOPIC_GPU", gpu_setting)
+
+    reducer, clusterer = _build_cluster_models()
+
+    if gpu_setting == "auto":
+        assert type(reducer).__name__ == "CumlUMAP"
+        assert type(clusterer).__name__ == "CumlHDBSCAN"
+    else:
+        assert isinstance(reducer, UMAP)
+        assert isinstance(clusterer, HDBSCAN)
+
+
+def test_build_cluster_models_falls_back_without_cuml(monkeypatch):
+    """Test that the CPU backends are used when cuML can't be imported."""
+    monkeypatch.setitem(sys.modules, "cuml", None)
+    monkeypatch.delenv("CKX_TOPIC_GPU", raising=False)
+
+    reducer, clusterer = _build_cluster_models()
+    assert isinstance(reducer, UMAP)
+    assert isinstance(clusterer, HDBSCAN)
+
+    with pytest.raises(ValueError):
+        _build_cluster_models("tsne")
+
+
+def test_discover_topics_with_pca(fake_embedder: Embedder, sample_documents: dict[str, str], monkeypatch):
+    """Test topic discovery with PCA in place of UMAP."""
+    monkeypatch.setitem(sys.modules, "cuml", None)
+
+    topic_model, embeddings, doc_ids = discover_topics(
+        documents=sample_documents,
+        embedder=fake_embedder,
+        target_topics=3,
+        use_pooling=False,
+        dim_reduction="pca",
+    )
+
+    assert isinstance(topic_model.umap_model, PCA)
+    assert len(topic_model.topics_) == len(doc_ids) == embeddings.shape[0]
@@ -2,7 +2,13 @@
 
 import pytest
 
-from ck_exporter.utils.chunking import chunk_messages, chunk_text, estimate_tokens
+from ck_exporter.utils import chunking
+from ck_exporter.utils.chunking import (
+    chunk_messages,
+    chunk_text,
+    chunk_texts_batch,
+    estimate_tokens,
+)
 
 
 def test_estimate_tokens():
@@ -13,6 +19,27 @@ def test_estimate_tokens():
     assert isinstance(tokens, int)
 
 
+def test_get_encoding_only_for_mapped_models(monkeypatch):
+    """Mapped models (provider prefix ignored) get an encoding; unmapped ones use the char estimate."""
+    requested = []
+
+    def fake_get_encoding(name):
+        requested.append(name)
+        return name
+
+    monkeypatch.setattr(chunking, "HAS_TIKTOKEN", True)
+    monkeypatch.setattr(chunking.tiktoken, "get_encoding", fake_get_encoding)
+    chunking._get_encoding.cache_clear()
+    try:
+        assert chunking._get_encoding("openai/gpt-4o") == "o200k_base"
+        assert chunking._get_encoding("text-embedding-3-small") == "cl100k_base"
+        assert chunking._get_encoding("z-ai/glm-4.7") is None
+        assert requested == ["o200k_base", "cl100k_base"]
+        assert estimate_tokens("x" * 40, model="z-ai/glm-4.7") == 10
+    finally:
+        chunking._get_encoding.cache_clear()
+
+
 def test_chunk_text_small():
     """Test chunking small text."""
     text = "This is a short text."
@@ -28,6 +55,64 @@ def test_chunk_text_large():
     assert len(chunks) > 1
 
 
+def test_chunk_text_large_overlap_makes_progress():
+    """Overlap larger than the window must not collapse into tiny steps."""
+    text = "x" * 20_000
+    chunks = chunk_text(text, max_tokens=100, overlap_tokens=500)
+    # Each step advances at least half a window (200 chars)
+    assert len(chunks) <= len(text) // 200 + 1
+    assert chunks[-1].endswith("x")
+
+
+def test_chunk_text_keeps_overlap_after_short_chunk():
+    """A chunk cut short at a sentence break still overlaps the next one."""
+    text = "A" * 100 + ".\n\n" + "B" * 800
+    chunks = chunk_text(text, max_tokens=100, overlap_tokens=20)
+    assert chunks[0] == "A" * 100 + "."
+    # The next chunk starts 80 chars (20 tokens) before the end of the first
+    assert chunks[1] == "A" * 77 + "."
+    assert "".join(chunks).endswith("B" * 100)
+
+
+def test_chunk_texts_batch_matches_chunk_text():
+    """Batch chunking yields the same chunks as per-text chunking, in order."""
+    texts = [
+        "Short text.",
+        "",
+        ". ".join([f"Sentence {i}" for i in range(100)]),
+    ]
+    batched = chunk_texts_batch(texts, max_tokens=50)
+    assert batched == [chunk_text(text, max_tokens=50) for text in texts]
+    assert chunk_texts_batch([]) == []
+
+
+class FakeEncoding:
+    """Encoding stand-in: one token per word, recording batch sizes."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def encode_ordinary(self, text):
+        return text.split()
+
+    def encode_ordinary_batch(self, texts, num_threads=8):
+        self.batch_sizes.append(len(texts))
+        return [self.encode_ordinary(text) for text in texts]
+
+
+def test_chunk_texts_batch_encodes_in_bounded_slices(monkeypatch):
+    """Texts are encoded a slice at a time and still line up with their chunks."""
+    encoding = FakeEncoding()
+    monkeypatch.setattr(chunking, "_get_encoding", lambda model: encoding)
+    monkeypatch.setattr(chunking, "_ENCODE_BATCH_SIZE", 2)
+    texts = [". ".join([f"Sentence {i}" for i in range(n * 20)]) for n in range(5)]
+
+    batched = chunk_texts_batch(texts, max_tokens=50)
+
+    assert encoding.batch_sizes == [2, 2, 1]
+    assert batched == [chunk_text(text, max_tokens=50) for text in texts]
+
+
 def test_chunk_messages():
     """Test chunking message list."""
     messages = [
@@ -70,6 +70,7 @@ def test_parse_iso_timestamp_with_z():
     result = parse_iso_timestamp(iso_str)
     assert result is not None
     assert isinstance(result, float)
+    assert result == parse_iso_timestamp("2025-12-18T18:06:43.449478+00:00")
 
 
 def test_parse_iso_timestamp_invalid():
@@ -114,6 +115,38 @@ def test_convert_claude_to_chatgpt_basic():
     assert "msg-2" in result["mapping"]
 
 
+def test_convert_claude_to_chatgpt_message_shape():
+    """Test converted messages carry the full ChatGPT message shape with per-message authors."""
+    claude_conv = {
+        "uuid": "claude-uuid-123",
+        "chat_messages": [
+            {"uuid": "msg-1", "sender": "human", "text": "Hello", "created_at": ""},
+            {"uuid": "msg-2", "sender": "human", "text": "Again", "created_at": ""},
+        ],
+    }
+
+    mapping = convert_claude_to_chatgpt(claude_conv)["mapping"]
+
+    assert mapping["msg-1"] == {
+        "id": "msg-1",
+        "parent": None,
+        "message": {
+            "id": "msg-1",
+            "author": {"role": "user", "name": None, "metadata": {}},
+            "create_time": None,
+            "update_time": None,
+            "content": {"content_type": "text", "parts": ["Hello"]},
+            "status": "finished_successfully",
+            "end_turn": True,
+            "weight": 1,
+            "metadata": {},
+            "recipient": "all",
+            "channel": None,
+        },
+    }
+    assert mapping["msg-1"]["message"]["author"] is not mapping["msg-2"]["message"]["author"]
+
+
 def test_convert_claude_to_chatgpt_sender_mapping():
     """Test sender mapping: human→user, assistant→assistant, unknown→system."""
     claude_conv = {
@@ -122,6 +155,8 @@ def test_convert_claude_to_chatgpt_sender_mapping():
             {"uuid": "msg-1", "sender": "human", "text": "Hello"},
             {"uuid": "msg-2", "sender": "assistant", "text": "Hi"},
             {"uuid": "msg-3", "sender": "unknown_type", "text": "System"},
+            {"uuid": "msg-4", "sender": "Human", "text": "Mixed case"},
+            {"uuid": "msg-5", "text": "No sender"},
         ],
     }
 
@@ -130,6 +165,8 @@ def test_convert_claude_to_chatgpt_sender_mapping():
     assert result["mapping"]["msg-1"]["message"]["author"]["role"] == "user"
     assert result["mapping"]["msg-2"]["message"]["author"]["role"] == "assistant"
     assert result["mapping"]["msg-3"]["message"]["author"]["role"] == "system"
+    assert result["mapping"]["msg-4"]["message"]["author"]["role"] == "user"
+    assert result["mapping"]["msg-5"]["message"]["author"]["role"] == "system"
 
 
 def test_convert_claude_to_chatgpt_parent_chain():
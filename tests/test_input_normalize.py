@@ -9,6 +9,7 @@ import pytest
 
 from ck_exporter.pipeline.io import (
     is_chatgpt_single_conversation,
+    iter_conversations,
     load_conversations,
 )
 
@@ -280,6 +281,32 @@ def test_load_conversations_directory_limit_deterministic():
         assert len(result) == 3
 
 
+def test_iter_conversations_reads_files_lazily(monkeypatch):
+    """Directory iteration should stop opening files once the limit is reached."""
+    from ck_exporter.pipeline.io import load as load_module
+
+    opened = []
+    real_load = load_module._load_conversations_file
+
+    def recording_load(path):
+        opened.append(path.name)
+        return real_load(path)
+
+    monkeypatch.setattr(load_module, "_load_conversations_file", recording_load)
+
+    with TemporaryDirectory() as d:
+        dir_path = Path(d)
+        for name in ["a_conv", "b_conv", "c_conv"]:
+            conv = {"title": name, "mapping": {}, "current_node": None}
+            (dir_path / f"{name}.json").write_text(json.dumps(conv), encoding="utf-8")
+
+        conversations = iter_conversations(dir_path, limit=2)
+        assert next(conversations)["conversation_id"] == "a_conv"
+        assert opened == ["a_conv.json"]
+        assert [c["conversation_id"] for c in conversations] == ["b_conv"]
+        assert opened == ["a_conv.json", "b_conv.json"]
+
+
 def test_load_conversations_list_limit():
     """List input with limit should return first N conversations."""
     conversations = [
@@ -343,3 +370,38 @@ def test_load_conversations_single_file_limit():
     finally:
         temp_path.unlink()
 
+
+
+def test_iter_conversations_streams_list_export(monkeypatch, tmp_path):
+    """Streaming a list export with ijson yields the same conversations as a full load."""
+    pytest.importorskip("ijson")
+    from ck_exporter.pipeline.io import load as load_module
+
+    conversations = [
+        {"mapping": {"n": {"message": {"create_time": 1704067200.5}}}, "current_node": "n"},
+        "not a conversation",
+        {"id": "conv-2", "title": "Second"},
+        {
+            "uuid": "claude-1",
+            "name": "Claude",
+            "platform": "CLAUDE_AI",
+            "chat_messages": [{"uuid": "m1", "sender": "human", "text": "hi"}],
+        },
+    ]
+    input_path = tmp_path / "export.json"
+    input_path.write_text("\n  " + json.dumps(conversations), encoding="utf-8")
+
+    def fail_full_load(path):
+        raise AssertionError("list export should be streamed")
+
+    with monkeypatch.context() as m:
+        m.setattr(load_module, "_load_conversations_file", fail_full_load)
+        streamed = list(iter_conversations(input_path))
+        assert [c.get("id") or c.get("conversation_id") for c in iter_conversations(input_path, limit=2)] == [
+            "export_0",
+            "conv-2",
+        ]
+
+    monkeypatch.setattr(load_module, "HAS_IJSON", False)
+    assert streamed == load_conversations(input_path)
+    assert isinstance(streamed[0]["mapping"]["n"]["message"]["create_time"], float)
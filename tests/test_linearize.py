@@ -112,6 +112,15 @@ def test_linearize_missing_parts():
     assert len(messages) == 0
 
 
+def test_linearize_cyclic_mapping(sample_conversation):
+    """A cyclic parent chain is cut at the first repeated node."""
+    sample_conversation["mapping"]["msg-1"]["parent"] = "msg-3"
+
+    messages = linearize_conversation(sample_conversation)
+
+    assert [msg["id"] for msg in messages] == ["msg-1", "msg-2", "msg-3"]
+
+
 def test_linearize_export_single_conversation():
     """Test linearize_export works with single conversation file (no id)."""
     single_conv = {
@@ -210,3 +219,20 @@ def test_linearize_export_claude_conversation():
         assert expected_conv_id in content
         assert "Hello from Claude" in content
         assert "Hi, how can I help?" in content
+
+
+def test_linearize_export_reports_totals(sample_conversation, tmp_path):
+    """The progress callback gets the conversation total up front and with every update."""
+    second = json.loads(json.dumps(sample_conversation))
+    second["id"] = "test-conv-456"
+    input_file = tmp_path / "export.json"
+    input_file.write_text(json.dumps([sample_conversation, second]), encoding="utf-8")
+    calls = []
+
+    linearize_export(
+        input_file,
+        tmp_path / "output",
+        progress_cb=lambda completed, total, context: calls.append((completed, total)),
+    )
+
+    assert calls == [(0, 2), (1, 2), (2, 2)]
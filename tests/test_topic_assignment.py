@@ -51,3 +51,120 @@ def test_cosine_similarity_normalized():
     vec2 = np.array([4.0, 5.0, 6.0])
     similarity = cosine_similarity(vec1, vec2)
     assert 0.0 <= similarity <= 1.0
+
+
+def test_assign_topics_ranks_and_flags(monkeypatch, tmp_path):
+    """Test primary/secondary ranking and review flags from the similarity matrix."""
+    from ck_exporter.core.models import Topic, TopicRegistry
+    from ck_exporter.pipeline import assignment
+
+    documents = {"clear": "a", "ambiguous": "b", "weak": "c"}
+    embeddings = np.array(
+        [
+            [1.0, 0.0, 0.0],  # matches topic 1 only
+            [1.0, 1.0, 0.0],  # equally close to topics 1 and 2
+            [0.0, 0.0, 1.0],  # orthogonal to every centroid
+        ]
+    )
+
+    class FakeEmbeddingClient:
+        def __init__(self, **kwargs):
+            pass
+
+        def get_embeddings(self, texts):
+            return embeddings
+
+    monkeypatch.setattr(assignment, "build_conversation_documents", lambda *args: (documents, {}))
+    monkeypatch.setattr(assignment, "EmbeddingClient", FakeEmbeddingClient)
+    registry = TopicRegistry(
+        embedding_model="test-model",
+        num_topics=2,
+        topics=[
+            Topic(topic_id=1, name="One", description="", centroid_embedding=[1.0, 0.0, 0.0]),
+            Topic(topic_id=2, name="Two", description="", centroid_embedding=[0.0, 1.0, 0.0]),
+        ],
+    )
+
+    results = assignment.assign_topics(
+        tmp_path / "missing.json",
+        tmp_path / "atoms.jsonl",
+        tmp_path / "decisions.jsonl",
+        tmp_path / "open_questions.jsonl",
+        registry,
+        embedding_model="test-model",
+        use_pooling=False,
+    )
+    by_id = {r.conversation_id: r for r in results}
+
+    clear = by_id["clear"]
+    assert [(t.topic_id, t.name, t.rank) for t in clear.topics] == [(1, "One", "primary")]
+    assert clear.topics[0].score == pytest.approx(1.0)
+    assert not clear.review_flag
+
+    ambiguous = by_id["ambiguous"]
+    assert [(t.topic_id, t.rank) for t in ambiguous.topics] == [(1, "primary"), (2, "secondary")]
+    assert ambiguous.review_flag
+
+    weak = by_id["weak"]
+    assert [t.score for t in weak.topics] == [0.0]
+    assert weak.review_flag
+
+
+def test_save_assignments_writes_jsonl_and_review_queue(tmp_path):
+    """Test every assignment is written and only flagged ones reach the review queue."""
+    import json
+
+    from ck_exporter.core.models import ConversationTopics, TopicAssignment
+    from ck_exporter.pipeline.assignment import save_assignments
+
+    assignments = [
+        ConversationTopics(
+            conversation_id="clear",
+            title="Clear",
+            topics=[TopicAssignment(topic_id=1, name="One", score=0.9, rank="primary")],
+            atom_count=2,
+        ),
+        ConversationTopics(
+            conversation_id="weak",
+            title="Weak",
+            topics=[TopicAssignment(topic_id=2, name="Two", score=0.3, rank="primary")],
+            atom_count=0,
+            review_flag=True,
+        ),
+    ]
+    output_path = tmp_path / "assignments.jsonl"
+
+    save_assignments(assignments, output_path)
+
+    rows = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert [row["conversation_id"] for row in rows] == ["clear", "weak"]
+    assert "project_id" not in rows[0]
+    review = [json.loads(line) for line in (tmp_path / "review_queue.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert review == [
+        {
+            "conversation_id": "weak",
+            "title": "Weak",
+            "primary_topic": "Two",
+            "primary_score": 0.3,
+            "reason": "low_confidence",
+        }
+    ]
+
+
+def test_load_topic_registry_round_trip(tmp_path):
+    """Test a registry written as JSON loads back into the model."""
+    from ck_exporter.core.models import Topic, TopicRegistry
+    from ck_exporter.pipeline.assignment import load_topic_registry
+
+    registry = TopicRegistry(
+        embedding_model="test-model",
+        num_topics=1,
+        topics=[Topic(topic_id=1, name="Ünïcode", description="", centroid_embedding=[0.5, 0.25])],
+    )
+    registry_path = tmp_path / "topic_registry.json"
+    registry_path.write_text(registry.model_dump_json(), encoding="utf-8")
+
+    assert load_topic_registry(registry_path) == registry
+
+    with pytest.raises(FileNotFoundError):
+        load_topic_registry(tmp_path / "missing.json")
@@ -0,0 +1,94 @@
+"""Unit tests for documentation compilation."""
+
+import json
+
+import pytest
+
+from ck_exporter.pipeline.compile import compile_conversation_docs, compile_docs, sanitize_filename
+
+
+def _write_atoms(atoms_dir, conversation_id):
+    conv_dir = atoms_dir / conversation_id
+    conv_dir.mkdir(parents=True)
+    fact = {"type": "fact", "topic": "architecture", "statement": f"Fact for {conversation_id}", "evidence": []}
+    decision = {"type": "decision", "topic": "storage / db", "statement": "Use SQLite", "evidence": []}
+    (conv_dir / "facts.jsonl").write_text(json.dumps(fact) + "\n", encoding="utf-8")
+    (conv_dir / "decisions.jsonl").write_text(json.dumps(decision) + "\n", encoding="utf-8")
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_compile_docs_writes_all_conversations(tmp_path, monkeypatch, workers):
+    """Test that sequential and thread-pool compilation produce the same docs."""
+    monkeypatch.setenv("CKX_COMPILE_WORKERS", workers)
+    atoms_dir = tmp_path / "_atoms"
+    docs_dir = tmp_path / "docs"
+    for conv_id in ["conv-a", "conv-b", "conv-c"]:
+        _write_atoms(atoms_dir, conv_id)
+
+    progress = []
+    compile_docs(atoms_dir, docs_dir, progress_cb=lambda done, total, ctx: progress.append((done, total)))
+
+    for conv_id in ["conv-a", "conv-b", "conv-c"]:
+        assert (docs_dir / conv_id / "overview.md").exists()
+        assert (docs_dir / conv_id / "architecture.md").exists()
+        assert (docs_dir / "decisions" / conv_id / "ADR-0001-storage-db.md").exists()
+    assert progress[-1] == (3, 3)
+
+
+def test_compile_conversation_docs_writes_every_adr(tmp_path):
+    """Test that each decision gets its own numbered ADR file."""
+    atoms_dir = tmp_path / "_atoms"
+    conv_dir = atoms_dir / "conv-a"
+    conv_dir.mkdir(parents=True)
+    decisions = [
+        {"type": "decision", "topic": f"topic {i}", "statement": f"Decision {i}", "evidence": []}
+        for i in range(1, 13)
+    ]
+    (conv_dir / "decisions.jsonl").write_text(
+        "".join(json.dumps(d) + "\n" for d in decisions), encoding="utf-8"
+    )
+
+    compile_conversation_docs("conv-a", atoms_dir, tmp_path / "docs")
+
+    adr_dir = tmp_path / "docs" / "decisions" / "conv-a"
+    assert sorted(p.name for p in adr_dir.iterdir()) == [
+        f"ADR-{i:04d}-topic-{i}.md" for i in range(1, 13)
+    ]
+    assert "Decision 12" in (adr_dir / "ADR-0012-topic-12.md").read_text(encoding="utf-8")
+
+
+def test_compile_conversation_docs_architecture_partition(tmp_path):
+    """Test that architecture.md gets only architecture-topic facts and decisions."""
+    atoms_dir = tmp_path / "_atoms"
+    conv_dir = atoms_dir / "conv-a"
+    conv_dir.mkdir(parents=True)
+    facts = [
+        {"type": "fact", "topic": "Pipeline", "statement": "Arch fact", "evidence": []},
+        {"type": "fact", "topic": "pricing", "statement": "Other fact", "evidence": []},
+    ]
+    decisions = [
+        {"type": "decision", "topic": "storage", "statement": "Arch decision", "evidence": []},
+        {"type": "decision", "topic": None, "statement": "Other decision", "evidence": []},
+    ]
+    (conv_dir / "facts.jsonl").write_text("".join(json.dumps(f) + "\n" for f in facts), encoding="utf-8")
+    (conv_dir / "decisions.jsonl").write_text("".join(json.dumps(d) + "\n" for d in decisions), encoding="utf-8")
+
+    compile_conversation_docs("conv-a", atoms_dir, tmp_path / "docs")
+
+    content = (tmp_path / "docs" / "conv-a" / "architecture.md").read_text(encoding="utf-8")
+    assert "Arch fact" in content and "Arch decision" in content
+    assert "Other fact" not in content and "Other decision" not in content
+
+
+@pytest.mark.parametrize(
+    "topic, expected",
+    [
+        ("storage / db", "storage-db"),
+        ('a<b>c:d"e\\f|g?h*i', "a-b-c-d-e-f-g-h-i"),
+        ("line\nbreak\x00", "line-break"),
+        (" . ", "unnamed"),
+    ],
+)
+def test_sanitize_filename(topic, expected):
+    """Test that invalid filename characters collapse to single hyphens."""
+    assert sanitize_filename(topic) == expected
@@ -42,3 +42,60 @@ def test_normalized_mean_pool_zero_vector():
     pooled = embedder._normalized_mean_pool(chunk_embeddings)
     # Should return zero vector (not normalized, since norm is 0)
     assert np.allclose(pooled, [0.0, 0.0, 0.0])
+
+
+def test_embed_concurrent_batches_preserve_order(monkeypatch):
+    """Test that concurrently submitted batches are returned in input order."""
+    import time
+    from types import SimpleNamespace
+
+    class FakeEmbeddings:
+        def create(self, model, input):
+            # Later batches finish first to exercise reordering
+            time.sleep(0.01 * (3 - int(input[0]) // 2))
+            return SimpleNamespace(data=[SimpleNamespace(embedding=[float(t), 1.0]) for t in input])
+
+    monkeypatch.setenv("CKX_EMBED_MAX_INFLIGHT", "4")
+    embedder = OpenRouterEmbedder(client=SimpleNamespace(embeddings=FakeEmbeddings()))
+    texts = [str(i) for i in range(6)]
+    result = embedder.embed(texts, batch_size=2)
+    assert result[:, 0].tolist() == [float(i) for i in range(6)]
+
+
+def test_embed_pooled_reuses_disk_cache(tmp_path):
+    """Test that a second embed_pooled run is served from the cache directory."""
+    from types import SimpleNamespace
+
+    calls = []
+
+    class FakeEmbeddings:
+        def create(self, model, input):
+            calls.append(list(input))
+            return SimpleNamespace(data=[SimpleNamespace(embedding=[1.0, float(len(t))]) for t in input])
+
+    embedder = OpenRouterEmbedder(client=SimpleNamespace(embeddings=FakeEmbeddings()))
+    texts = ["first conversation", "second conversation text"]
+
+    first = embedder.embed_pooled(texts, cache_dir=tmp_path)
+    second = embedder.embed_pooled(texts, cache_dir=tmp_path)
+
+    assert len(calls) == 1
+    assert np.allclose(first, second)
+
+
+def test_pool_by_document_matches_per_document_pooling():
+    """Vectorized pooling matches _normalized_mean_pool per document; chunkless docs get zeros."""
+    embedder = OpenRouterEmbedder(model="openai/text-embedding-3-small", use_openrouter=False)
+    rng = np.random.default_rng(0)
+    chunk_embeddings = rng.normal(size=(6, 4))
+    chunk_embeddings[3] = 0.0
+    chunk_to_doc_idx = [0, 0, 0, 2, 3, 3]
+
+    pooled = embedder._pool_by_document(chunk_embeddings, chunk_to_doc_idx, num_docs=5)
+
+    assert pooled.shape == (5, 4)
+    assert np.allclose(pooled[0], embedder._normalized_mean_pool(chunk_embeddings[0:3]))
+    assert np.allclose(pooled[1], 0.0)
+    assert np.allclose(pooled[2], 0.0)
+    assert np.allclose(pooled[3], embedder._normalized_mean_pool(chunk_embeddings[4:6]))
+    assert np.allclose(pooled[4], 0.0)
@@ -0,0 +1,215 @@
+"""Tests for Batch API extraction (offline, using a fake OpenAI client)."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from ck_exporter.adapters.openrouter_atom_extractor import OpenRouterAtomExtractor
+from ck_exporter.extract_openai import validate_batch_options
+from ck_exporter.pipeline import extract_batch
+from ck_exporter.pipeline.extract_batch import extract_export_batch, parse_batch_output
+
+
+class FakeLLMClient:
+    """Fake LLM client used for Pass 2 refinement."""
+
+    def __init__(self):
+        self.calls = []
+
+    def chat(self, model, system, user, *, temperature=0.3, json_object=False):
+        self.calls.append(user)
+        # An empty refinement keeps the Pass 1 candidates as-is
+        return ""
+
+
+def _result_line(custom_id: str) -> str:
+    content = json.dumps(
+        {
+            "facts": [{"type": "fact", "statement": custom_id}],
+            "decisions": [],
+            "open_questions": [],
+        }
+    )
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": content}}]},
+            },
+            "error": None,
+        }
+    )
+
+
+class FakeBatchClient:
+    """Fake OpenAI client implementing the files and batches endpoints."""
+
+    def __init__(self, failed_ids: tuple[str, ...] = ()):
+        self.failed_ids = failed_ids
+        self.uploaded = []
+        self.events = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+
+    def _create_file(self, file, purpose):
+        assert purpose == "batch"
+        self.uploaded.append([json.loads(line) for line in file[1].decode("utf-8").splitlines()])
+        return SimpleNamespace(id=f"in-{len(self.uploaded) - 1}")
+
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        self.events.append(("create", input_file_id))
+        return SimpleNamespace(id=input_file_id, status="in_progress", output_file_id=None, error_file_id=None)
+
+    def _retrieve_batch(self, batch_id):
+        self.events.append(("retrieve", batch_id))
+        return SimpleNamespace(
+            id=batch_id, status="completed", output_file_id=f"out:{batch_id}", error_file_id=f"err:{batch_id}"
+        )
+
+    def _file_content(self, file_id):
+        kind, _, batch_id = file_id.partition(":")
+        requests = self.uploaded[int(batch_id.split("-")[1])]
+        if kind == "out":
+            lines = [_result_line(r["custom_id"]) for r in requests if r["custom_id"] not in self.failed_ids]
+            lines.append("not json")
+            lines.reverse()
+        else:
+            lines = [
+                json.dumps({"custom_id": r["custom_id"], "response": None, "error": {"code": "invalid_request"}})
+                for r in requests
+                if r["custom_id"] in self.failed_ids
+            ]
+        return SimpleNamespace(text="\n".join(lines))
+
+
+def _conversation(conv_id: str, texts: list[str]) -> dict:
+    mapping = {}
+    parent = None
+    for i, text in enumerate(texts):
+        node_id = f"{conv_id}-msg-{i}"
+        mapping[node_id] = {
+            "id": node_id,
+            "parent": parent,
+            "message": {
+                "id": node_id,
+                "author": {"role": "user"},
+                "create_time": 1704067200.0 + i,
+                "content": {"parts": [text]},
+            },
+        }
+        parent = node_id
+    return {"id": conv_id, "title": conv_id, "mapping": mapping, "current_node": parent}
+
+
+def test_extract_export_batch_fans_results_back_out(tmp_path: Path, monkeypatch):
+    """Each chunk becomes one batch request; results are merged per conversation in chunk order."""
+    monkeypatch.setattr(extract_batch, "_BATCH_MAX_REQUESTS", 3)
+    input_path = tmp_path / "export.json"
+    input_path.write_text(
+        json.dumps(
+            [
+                _conversation("conv-a", ["a" * 400, "b" * 400, "c" * 400]),
+                _conversation("conv-b", ["hello"]),
+            ]
+        )
+    )
+    atoms_dir = tmp_path / "atoms"
+    llm = FakeLLMClient()
+    extractor = OpenRouterAtomExtractor(fast_llm=llm, big_llm=llm)
+    client = FakeBatchClient(failed_ids=("conv-a:1",))
+
+    extract_export_batch(
+        input_path,
+        atoms_dir,
+        extractor,
+        client,
+        max_chunk_tokens=150,
+        poll_interval=0,
+    )
+
+    custom_ids = [request["custom_id"] for requests in client.uploaded for request in requests]
+    assert custom_ids == ["conv-a:0", "conv-a:1", "conv-a:2", "conv-b:0"]
+    assert client.uploaded[0][0]["url"] == "/v1/chat/completions"
+    # Both batches are submitted before either is polled
+    assert [event[0] for event in client.events] == ["create", "create", "retrieve", "retrieve"]
+
+    facts_a = [
+        json.loads(line)["statement"]
+        for line in (atoms_dir / "conv-a" / "facts.jsonl").read_text().splitlines()
+    ]
+    assert facts_a == ["conv-a:0", "conv-a:2"]
+    assert (atoms_dir / "conv-b" / "facts.jsonl").exists()
+    # Pass 1 went through the batch; only Pass 2 used the live client
+    assert len(llm.calls) == 2
+
+
+def test_parse_batch_output_skips_bad_records():
+    """Malformed lines, failed requests and unexpected bodies are skipped, not fatal."""
+    llm = FakeLLMClient()
+    extractor = OpenRouterAtomExtractor(fast_llm=llm, big_llm=llm)
+    lines = [
+        "{truncated",
+        json.dumps({"custom_id": "conv-a:0", "response": {"status_code": 200, "body": {}}}),
+        json.dumps({"custom_id": "conv-a:1", "response": {"status_code": 429, "body": {"error": {}}}}),
+        _result_line("conv-a:2"),
+    ]
+
+    candidates = parse_batch_output(lines, extractor)
+
+    assert [fact["statement"] for fact in candidates["conv-a"]["facts"]] == ["conv-a:2"]
+
+
+def test_parse_batch_output_recovers_fenced_json():
+    """Completions wrapped in a ```json fence are parsed; bad ones don't trigger live repair calls."""
+    llm = FakeLLMClient()
+    extractor = OpenRouterAtomExtractor(fast_llm=llm, big_llm=llm)
+    fenced = "```json\n" + json.dumps({"facts": [{"type": "fact", "statement": "fenced"}]}) + "\n```"
+    lines = [
+        json.dumps(
+            {
+                "custom_id": f"conv-a:{idx}",
+                "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}},
+                "error": None,
+            }
+        )
+        for idx, content in enumerate([fenced, "not json at all"])
+    ]
+
+    candidates = parse_batch_output(lines, extractor)
+
+    assert [fact["statement"] for fact in candidates["conv-a"]["facts"]] == ["fenced"]
+    assert llm.calls == []
+
+
+def test_split_payloads_respects_byte_limit(monkeypatch):
+    """Payloads are split once the next request would exceed the byte limit."""
+    monkeypatch.setattr(extract_batch, "_BATCH_MAX_BYTES", 130)
+    requests = [{"custom_id": f"c:{i}", "body": "x" * 30} for i in range(4)]
+
+    payloads = extract_batch._split_payloads(requests)
+
+    assert [count for _, count in payloads] == [2, 2]
+    assert all(len(payload) <= 130 for payload, _ in payloads)
+
+
+@pytest.mark.parametrize(
+    "use_openrouter,fast_model,big_model",
+    [
+        (True, "gpt-4o-mini", "gpt-4o"),
+        (False, None, "gpt-4o"),
+        (False, "z-ai/glm-4.7", "gpt-4o"),
+        (False, "gpt-4o-mini", "z-ai/glm-4.7"),
+    ],
+)
+def test_validate_batch_options_rejects_openrouter_setups(use_openrouter, fast_model, big_model, monkeypatch):
+    """Batch runs need the OpenAI API and OpenAI model ids for both passes."""
+    monkeypatch.delenv("CKX_FAST_MODEL", raising=False)
+    monkeypatch.delenv("CKX_BIG_MODEL", raising=False)
+
+    with pytest.raises(ValueError):
+        validate_batch_options(use_openrouter, fast_model, big_model)
+
+    validate_batch_options(False, "gpt-4o-mini", "gpt-4o")
@@ -0,0 +1,55 @@
+"""Unit tests for JSONL file helpers."""
+
+import json
+
+import pytest
+
+from ck_exporter.adapters.fs_jsonl import load_atoms_jsonl, read_jsonl
+from ck_exporter.utils import fast_json
+
+
+def test_load_atoms_jsonl_skips_blank_and_invalid_lines(tmp_path):
+    """Test that blank and malformed lines are skipped."""
+    path = tmp_path / "facts.jsonl"
+    path.write_text('{"statement": "a"}\n\n  \nnot json\n{"statement": "ünïcode"}\n', encoding="utf-8")
+
+    atoms = load_atoms_jsonl(path)
+
+    assert atoms == [{"statement": "a"}, {"statement": "ünïcode"}]
+
+
+def test_load_atoms_jsonl_missing_file(tmp_path):
+    """Test that a missing file yields no atoms."""
+    assert load_atoms_jsonl(tmp_path / "missing.jsonl") == []
+
+
+def test_read_jsonl_yields_only_dicts(tmp_path):
+    """Test that non-object rows are ignored."""
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"a": 1}\n[1, 2]\n{"b": 2}\n', encoding="utf-8")
+
+    assert list(read_jsonl(path)) == [{"a": 1}, {"b": 2}]
+
+
+def test_fast_json_round_trip():
+    """Test that dumps/loads round-trip and keep non-ASCII text."""
+    obj = {"text": "naïve ✓", "n": 3, "nested": [1.5, None, True]}
+    encoded = fast_json.dumps(obj)
+
+    assert "\n" not in encoded
+    assert "✓" in encoded
+    assert fast_json.loads(encoded) == obj
+    assert fast_json.loads(encoded.encode("utf-8")) == obj
+
+
+def test_fast_json_pretty_matches_stdlib_indent():
+    """Test that pretty output matches json.dumps(indent=2) for plain data."""
+    obj = {"topics": [{"id": 1, "name": "naïve"}], "empty": []}
+
+    assert fast_json.dumps(obj, pretty=True) == json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def test_fast_json_loads_raises_json_decode_error():
+    """Test that invalid input raises the stdlib decode error type."""
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads("{not json")
@@ -0,0 +1,36 @@
+"""Unit tests for structured log formatting."""
+
+import json
+import logging
+from pathlib import Path
+
+from ck_exporter.logging import JsonFormatter
+
+
+def test_json_formatter_emits_extras_and_utc_timestamp():
+    """Extras are emitted, LogRecord internals are not, and ts is the record's UTC time."""
+    record = logging.LogRecord("ck_exporter.test", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    record.created = 1704067200.25
+    record.event = "test.event"
+    record.conversation_id = "conv-1"
+
+    data = json.loads(JsonFormatter().format(record))
+
+    assert data == {
+        "ts": "2024-01-01T00:00:00.250000Z",
+        "level": "INFO",
+        "logger": "ck_exporter.test",
+        "message": "hello world",
+        "event": "test.event",
+        "conversation_id": "conv-1",
+    }
+
+
+def test_json_formatter_stringifies_non_json_extras():
+    """Extras the encoder can't handle are logged as strings instead of failing the record."""
+    record = logging.LogRecord("ck_exporter.test", logging.INFO, __file__, 1, "wrote", (), None)
+    record.output_path = Path("out") / "conversation.md"
+
+    data = json.loads(JsonFormatter().format(record))
+
+    assert data["output_path"] == str(Path("out") / "conversation.md")
@@ -0,0 +1,64 @@
+"""Unit tests for OpenRouterAtomExtractor."""
+
+import json
+from pathlib import Path
+
+from ck_exporter.adapters.openrouter_atom_extractor import OpenRouterAtomExtractor
+
+
+class FakeLLMClient:
+    """Fake LLM client returning queued responses."""
+
+    def __init__(self, responses: list[str]):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def chat(self, model, system, user, *, temperature=0.3, json_object=False):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_extract_from_chunk_caches_results(tmp_path: Path):
+    """A cached chunk skips the LLM; empty results are not cached."""
+    response = json.dumps(
+        {"facts": [{"type": "fact", "statement": "cached"}], "decisions": [], "open_questions": []}
+    )
+    empty = json.dumps({"facts": [], "decisions": [], "open_questions": []})
+    llm = FakeLLMClient([response, empty, empty])
+    extractor = OpenRouterAtomExtractor(fast_llm=llm, big_llm=llm, cache_dir=tmp_path)
+
+    first = extractor.extract_from_chunk("chunk one")
+    second = OpenRouterAtomExtractor(fast_llm=llm, big_llm=llm, cache_dir=tmp_path).extract_from_chunk(
+        "chunk one"
+    )
+    assert second == first
+    assert first["facts"][0]["statement"] == "cached"
+    assert llm.calls == 1
+
+    extractor.extract_from_chunk("chunk two")
+    extractor.extract_from_chunk("chunk two")
+    assert llm.calls == 3
+
+    # A different model must not reuse another model's results
+    other = OpenRouterAtomExtractor(
+        fast_llm=FakeLLMClient([response]), big_llm=llm, fast_model="other/model", cache_dir=tmp_path
+    )
+    other.extract_from_chunk("chunk one")
+    assert other.fast_llm.calls == 1
+
+
+def test_chunk_cache_key_includes_temperature(tmp_path: Path, monkeypatch):
+    """Changing the Pass 1 temperature invalidates cached chunks; no temp files are left behind."""
+    from ck_exporter.adapters import openrouter_atom_extractor
+
+    response = json.dumps({"facts": [{"type": "fact", "statement": "x"}], "decisions": [], "open_questions": []})
+    llm = FakeLLMClient([response, response])
+    extractor = OpenRouterAtomExtractor(fast_llm=llm, big_llm=llm, cache_dir=tmp_path)
+
+    extractor.extract_from_chunk("chunk one")
+    monkeypatch.setattr(openrouter_atom_extractor, "PASS1_TEMPERATURE", 0.0)
+    extractor.extract_from_chunk("chunk one")
+
+    assert llm.calls == 2
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,20 @@
+"""Unit tests for the shared OpenRouter/OpenAI client factory."""
+
+from ck_exporter.adapters.openrouter_client import make_openrouter_client
+
+
+def test_make_openrouter_client_reuses_client_per_configuration(monkeypatch):
+    """Adapters built with the same configuration share one client (and connection pool)."""
+    monkeypatch.setenv("OPENROUTER_API_KEY", "key-a")
+    monkeypatch.delenv("OPENROUTER_HTTP_REFERER", raising=False)
+
+    client = make_openrouter_client(True)
+
+    assert make_openrouter_client(True) is client
+    assert str(client.base_url).startswith("https://openrouter.ai/api/v1")
+
+    monkeypatch.setenv("OPENROUTER_API_KEY", "key-b")
+    assert make_openrouter_client(True) is not client
+    monkeypatch.setenv("OPENROUTER_API_KEY", "key-a")
+    monkeypatch.setenv("OPENROUTER_HTTP_REFERER", "https://example.com")
+    assert make_openrouter_client(True) is not client